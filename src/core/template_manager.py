@@ -4,7 +4,7 @@
 """
 import json
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Union, Callable
+from typing import Dict, List, Optional, Any, Union, Callable, NamedTuple
 from datetime import datetime
 from dataclasses import dataclass, asdict
 
@@ -37,6 +37,19 @@ class TemplateMetadata:
         return cls(**data)
 
 
+class TemplateIndexEntry(NamedTuple):
+    """模板列表所需的最小元数据"""
+    id: str
+    name: str
+    version: str
+    category: str
+    
+    @classmethod
+    def from_metadata(cls, metadata: Dict[str, Any]) -> 'TemplateIndexEntry':
+        """从模板元数据提取"""
+        return cls(metadata['id'], metadata['name'], metadata['version'], metadata.get('category', '其他'))
+
+
 class TemplateVariable:
     """模板变量基类"""
     
@@ -165,10 +178,30 @@ class TemplateManager:
         self.metadata_file = self.templates_dir / "metadata.json"
         self.engine = TemplateEngine()
         self.templates = {}
+        self._metadata_mtime: Optional[float] = None  # 已加载的元数据文件修改时间
+        self._categories_cache: Optional[List[str]] = None
+        self._index_cache: Optional[List[TemplateIndexEntry]] = None
         self.load_templates()
     
+    def _metadata_mtime_now(self) -> Optional[float]:
+        """元数据文件当前的修改时间"""
+        try:
+            return self.metadata_file.stat().st_mtime
+        except OSError:
+            return None
+    
+    def reload_if_changed(self) -> bool:
+        """元数据文件被外部修改时重新加载，返回是否重新加载"""
+        if self._metadata_mtime_now() == self._metadata_mtime:
+            return False
+        self.load_templates()
+        return True
+    
     def load_templates(self):
         """加载模板"""
+        self._categories_cache = None
+        self._index_cache = None
+        self._metadata_mtime = self._metadata_mtime_now()
         if self.metadata_file.exists():
             try:
                 with open(self.metadata_file, 'r', encoding='utf-8') as f:
@@ -181,9 +214,12 @@ class TemplateManager:
     
     def save_templates(self):
         """保存模板元数据"""
+        self._categories_cache = None
+        self._index_cache = None
         try:
             with open(self.metadata_file, 'w', encoding='utf-8') as f:
                 json.dump(self.templates, f, ensure_ascii=False, indent=2)
+            self._metadata_mtime = self._metadata_mtime_now()
             return True
         except Exception as e:
             print(f"保存模板元数据失败: {e}")
@@ -193,6 +229,17 @@ class TemplateManager:
         """列出所有模板"""
         return list(self.templates.values())
     
+    def list_index(self) -> List[TemplateIndexEntry]:
+        """列出所有模板的轻量索引（不含描述、标签、变量等）"""
+        if self._index_cache is None:
+            self._index_cache = [TemplateIndexEntry.from_metadata(metadata) for metadata in self.templates.values()]
+        return list(self._index_cache)
+    
+    def get_index_entry(self, template_id: str) -> Optional[TemplateIndexEntry]:
+        """获取单个模板的轻量索引"""
+        metadata = self.templates.get(template_id)
+        return TemplateIndexEntry.from_metadata(metadata) if metadata else None
+    
     def get_template(self, template_id: str) -> Optional[Dict[str, Any]]:
         """获取模板"""
         if template_id not in self.templates:
@@ -318,10 +365,9 @@ class TemplateManager:
     
     def get_categories(self) -> List[str]:
         """获取所有分类"""
-        categories = set()
-        for template in self.templates.values():
-            categories.add(template['category'])
-        return sorted(list(categories))
+        if self._categories_cache is None:
+            self._categories_cache = sorted({template['category'] for template in self.templates.values()})
+        return list(self._categories_cache)
     
     def search_templates(self, query: str) -> List[Dict[str, Any]]:
         """搜索模板"""
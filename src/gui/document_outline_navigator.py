@@ -3,6 +3,9 @@
 实现文档结构解析和大纲树形控件功能，支持Markdown和Word文档
 """
 import re
+import sys
+from bisect import bisect_right
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QTreeWidget, QTreeWidgetItem,
@@ -21,33 +24,61 @@ except ImportError:
     WordOutlineItem = None
 
 
+# 存放小写文本的数据角色，供过滤时复用
+_FILTER_TEXT_ROLE = Qt.ItemDataRole.UserRole + 1
+
+# 大纲项类型（驻留字符串，相等比较退化为指针比较）
+_ITEM_TYPES = {
+    item_type: sys.intern(item_type)
+    for item_type in ("heading", "list", "code_block", "table", "quote", "paragraph")
+}
+
+# 大纲项类型前缀
+_TYPE_PREFIX = {
+    "heading": "",
+    "list": "• ",
+    "code_block": "⚡ ",
+    "table": "📊 ",
+    "quote": "❝ "
+}
+
+
+# 可能构成大纲项的行首字符（标题、列表、表格、引用）
+_MARKDOWN_MARKERS = frozenset('#-*+|>')
+
+
+@lru_cache(maxsize=16)
+def _indent(level: int) -> str:
+    """获取层级缩进字符串"""
+    return "  " * (level - 1) if level > 1 else ""
+
+
 class OutlineItem:
     """大纲项数据类"""
     
+    # 大文档会创建成千上万个节点，使用 __slots__ 省去每个实例的 __dict__
+    __slots__ = ('text', 'level', 'line_number', 'item_type', 'children', 'parent')
+    
     def __init__(self, text: str, level: int, line_number: int, item_type: str = "heading"):
         self.text = text.strip()
         self.level = level
         self.line_number = line_number
-        self.item_type = item_type  # heading, list, code_block, etc.
+        self.item_type = _ITEM_TYPES.get(item_type) or sys.intern(item_type)  # heading, list, code_block, etc.
         self.children: List['OutlineItem'] = []
         self.parent: Optional['OutlineItem'] = None
     
-    def add_child(self, child: 'OutlineItem'):
+    def add_child(self, child: 'OutlineItem') -> None:
         """添加子项"""
         child.parent = self
         self.children.append(child)
     
+    def shifted(self, delta: int = 0) -> 'OutlineItem':
+        """复制为不带层次关系的新项，行号偏移 delta"""
+        return OutlineItem(self.text, self.level, self.line_number + delta, self.item_type)
+    
     def get_display_text(self) -> str:
         """获取显示文本"""
-        prefix = "  " * (self.level - 1) if self.level > 1 else ""
-        type_prefix = {
-            "heading": "",
-            "list": "• ",
-            "code_block": "⚡ ",
-            "table": "📊 ",
-            "quote": "❝ "
-        }.get(self.item_type, "")
-        return f"{prefix}{type_prefix}{self.text}"
+        return f"{_indent(self.level)}{_TYPE_PREFIX.get(self.item_type, '')}{self.text}"
 
 
 class DocumentParser:
@@ -62,6 +93,8 @@ class DocumentParser:
         self.list_pattern = re.compile(r'^[\s]*[-*+]\s+(.+)$', re.MULTILINE)
         # 代码块正则
         self.code_block_pattern = re.compile(r'^```[^\n]*\n?([^`]+)```', re.MULTILINE)
+        # 代码块围栏正则（允许行首空白）
+        self.fence_pattern = re.compile(r'^[^\S\n]*```', re.MULTILINE)
         # 表格正则
         self.table_pattern = re.compile(r'^\|.+\|$', re.MULTILINE)
         # 引用正则
@@ -93,7 +126,7 @@ class DocumentParser:
             word_outline_items = self.word_parser.get_outline_items(file_path)
             
             # 转换为本地OutlineItem格式
-            outline_items = []
+            outline_items: List[OutlineItem] = []
             for word_item in word_outline_items:
                 outline_item = OutlineItem(
                     text=word_item.text,
@@ -111,19 +144,47 @@ class DocumentParser:
     
     def parse_markdown(self, content: str) -> List[OutlineItem]:
         """解析Markdown文档 - 优化版本"""
-        items = []
-        lines = content.split('\n')
-        in_code_block = False
+        return self.build_hierarchy(self.parse_markdown_lines(content.split('\n')))
+    
+    def parse_markdown_lines(self, lines: List[str], line_offset: int = 0) -> List[OutlineItem]:
+        """逐行解析Markdown，返回未构建层次的扁平项目列表"""
+        items: List[OutlineItem] = []
         table_started = False
         
-        for i, line in enumerate(lines, 1):
-            # 检查代码块状态
-            if line.strip().startswith('```'):
-                in_code_block = self._handle_code_block(line, i, in_code_block, items)
-                continue
-            
-            # 在代码块内跳过解析
-            if in_code_block:
+        # 预先定位所有代码块围栏，代码块内的行整段跳过
+        fence_lines = self._find_fence_lines(lines)
+        segment_start = 0
+        for index in range(0, len(fence_lines), 2):
+            open_line = fence_lines[index]
+            table_started = self._parse_markdown_segment(
+                lines, segment_start, open_line, line_offset, items, table_started
+            )
+            self._add_code_block_item(lines[open_line], open_line + line_offset + 1, items)
+            # 未闭合的代码块延续到文档末尾
+            segment_start = fence_lines[index + 1] + 1 if index + 1 < len(fence_lines) else len(lines)
+        
+        self._parse_markdown_segment(lines, segment_start, len(lines), line_offset, items, table_started)
+        return items
+    
+    def _find_fence_lines(self, lines: List[str]) -> List[int]:
+        """一次正则扫描找出代码块围栏所在的行索引"""
+        text = '\n'.join(lines)
+        fence_lines: List[int] = []
+        line_index = 0
+        last_pos = 0
+        for match in self.fence_pattern.finditer(text):
+            line_index += text.count('\n', last_pos, match.start())
+            last_pos = match.start()
+            fence_lines.append(line_index)
+        return fence_lines
+    
+    def _parse_markdown_segment(self, lines: List[str], start: int, end: int, line_offset: int,
+                                items: List[OutlineItem], table_started: bool) -> bool:
+        """解析代码块之外的一段连续行，返回段末的表格状态"""
+        for i, line in enumerate(lines[start:end], start + line_offset + 1):
+            # 大多数行是普通正文，按首字符快速排除，省去逐个正则匹配
+            if line.lstrip()[:1] not in _MARKDOWN_MARKERS:
+                table_started = False
                 continue
             
             # 解析各种内容类型
@@ -144,16 +205,47 @@ class DocumentParser:
             if self._parse_quote(line, i, items):
                 continue
         
-        return self.build_hierarchy(items)
-    
-    def _handle_code_block(self, line: str, line_num: int, in_code_block: bool, items: List[OutlineItem]) -> bool:
-        """处理代码块"""
-        if not in_code_block:
-            code_title = line.strip()[3:].strip()
-            if code_title:
-                items.append(OutlineItem(f"代码块: {code_title}", 7, line_num, "code_block"))
-            return True
-        return False
+        return table_started
+    
+    def parse_markdown_incremental(self, old_lines: List[str], old_items: List[OutlineItem],
+                                   new_lines: List[str]) -> List[OutlineItem]:
+        """增量解析Markdown，仅重新解析变化的行区间
+        
+        old_items 为上次 parse_markdown_lines 的扁平结果。代码块状态会跨行传递，
+        调用方需保证新旧内容都不含代码块围栏。
+        """
+        old_count, new_count = len(old_lines), len(new_lines)
+        
+        # 找出公共前缀和公共后缀
+        limit = min(old_count, new_count)
+        start = 0
+        while start < limit and old_lines[start] == new_lines[start]:
+            start += 1
+        old_end, new_end = old_count, new_count
+        while old_end > start and new_end > start and old_lines[old_end - 1] == new_lines[new_end - 1]:
+            old_end -= 1
+            new_end -= 1
+        
+        # 表格识别依赖前一行的状态，将区间扩展到两侧的非表格行
+        while start > 0 and new_lines[start - 1].strip().startswith('|'):
+            start -= 1
+        while new_end < new_count and new_lines[new_end].strip().startswith('|'):
+            old_end += 1
+            new_end += 1
+        
+        line_numbers = [item.line_number for item in old_items]
+        delta = new_end - old_end
+        # 旧项目仍被当前大纲树和行号索引引用，复用时复制而不是原地修改
+        head = [item.shifted() for item in old_items[:bisect_right(line_numbers, start)]]
+        tail = [item.shifted(delta) for item in old_items[bisect_right(line_numbers, old_end):]]
+        
+        return head + self.parse_markdown_lines(new_lines[start:new_end], start) + tail
+    
+    def _add_code_block_item(self, line: str, line_num: int, items: List[OutlineItem]) -> None:
+        """添加代码块项（仅带标题的代码块）"""
+        code_title = line.strip()[3:].strip()
+        if code_title:
+            items.append(OutlineItem(f"代码块: {code_title}", 7, line_num, "code_block"))
     
     def _parse_heading(self, line: str, line_num: int, items: List[OutlineItem]) -> bool:
         """解析标题"""
@@ -197,7 +289,7 @@ class DocumentParser:
     
     def parse_html(self, content: str) -> List[OutlineItem]:
         """解析HTML文档"""
-        items = []
+        items: List[OutlineItem] = []
         lines = content.split('\n')
         
         for i, line in enumerate(lines, 1):
@@ -212,7 +304,7 @@ class DocumentParser:
     
     def parse_plain_text(self, content: str) -> List[OutlineItem]:
         """解析纯文本文档"""
-        items = []
+        items: List[OutlineItem] = []
         lines = content.split('\n')
         paragraph_count = 0
         
@@ -234,8 +326,8 @@ class DocumentParser:
         if not items:
             return []
         
-        root_items = []
-        stack = []
+        root_items: List[OutlineItem] = []
+        stack: List[OutlineItem] = []
         
         for item in items:
             # 清理栈，移除比当前项级别高的项
@@ -267,7 +359,11 @@ class OutlineTreeWidget(QTreeWidget):
         self.init_ui()
         self.setup_context_menu()
         self.current_line = 0
-        self.outline_items = []
+        self.outline_items: List[OutlineItem] = []
+        # 上次高亮的项目，以及按行号排序的 (行号列表, 项目列表) 索引
+        self._last_highlighted: Optional[QTreeWidgetItem] = None
+        self._line_numbers: List[int] = []
+        self._line_items: List[QTreeWidgetItem] = []
     
     def init_ui(self):
         """初始化界面"""
@@ -275,6 +371,7 @@ class OutlineTreeWidget(QTreeWidget):
         self.setAlternatingRowColors(True)
         self.setRootIsDecorated(True)
         self.setExpandsOnDoubleClick(True)
+        self._init_font_cache()
         
         # 设置列宽
         header = self.header()
@@ -356,58 +453,91 @@ class OutlineTreeWidget(QTreeWidget):
     
     def update_outline(self, outline_items: List[OutlineItem]):
         """更新大纲"""
-        self.clear()
-        self.outline_items = outline_items
-        self._populate_tree(outline_items, None)
-        self.expandAll()
-    
-    def _populate_tree(self, items: List[OutlineItem], parent_widget_item):
-        """填充树形结构"""
+        # 批量更新期间暂停重绘和信号，避免逐项插入触发布局
+        self.setUpdatesEnabled(False)
+        self.blockSignals(True)
+        try:
+            self.clear()
+            self._last_highlighted = None
+            self.outline_items = outline_items
+            line_index = []
+            self.addTopLevelItems(self._build_tree_items(outline_items, line_index))
+            line_index.sort(key=lambda entry: entry[0])
+            self._line_numbers = [line for line, _ in line_index]
+            self._line_items = [widget_item for _, widget_item in line_index]
+            self.expandAll()
+        finally:
+            self.blockSignals(False)
+            self.setUpdatesEnabled(True)
+    
+    def _build_tree_items(self, items: List[OutlineItem], line_index: list) -> List[QTreeWidgetItem]:
+        """在树外构建项目及其子项，同时收集 (行号, 项目) 索引"""
+        widget_items = []
         for item in items:
-            if parent_widget_item:
-                widget_item = QTreeWidgetItem(parent_widget_item)
-            else:
-                widget_item = QTreeWidgetItem(self)
-            
-            widget_item.setText(0, item.text)
-            widget_item.setText(1, str(item.line_number))
+            widget_item = QTreeWidgetItem([item.text, str(item.line_number)])
             widget_item.setData(0, Qt.ItemDataRole.UserRole, item.line_number)
+            widget_item.setData(0, _FILTER_TEXT_ROLE, item.text.lower())
+            if item.line_number:
+                line_index.append((item.line_number, widget_item))
             
             # 设置图标和样式
             self._set_item_style(widget_item, item)
             
-            # 递归添加子项
+            # 递归构建子项，一次性添加
             if item.children:
-                self._populate_tree(item.children, widget_item)
+                widget_item.addChildren(self._build_tree_items(item.children, line_index))
+            
+            widget_items.append(widget_item)
+        return widget_items
+    
+    def _init_font_cache(self):
+        """预先创建各类大纲项使用的字体"""
+        heading_major = QFont()
+        heading_major.setBold(True)
+        heading_major.setPointSize(10)
+        
+        heading_minor = QFont()
+        heading_minor.setPointSize(9)
+        
+        heading_small = QFont()
+        heading_small.setPointSize(8)
+        
+        list_font = QFont()
+        list_font.setItalic(True)
+        list_font.setPointSize(8)
+        
+        code_font = QFont()
+        code_font.setFamily("Courier")
+        code_font.setPointSize(8)
+        
+        self._font_cache = {
+            ("heading", 2): heading_major,
+            ("heading", 4): heading_minor,
+            ("heading", 6): heading_small,
+            ("list", 0): list_font,
+            ("code_block", 0): code_font,
+            (None, 0): QFont(),
+        }
     
     def _set_item_style(self, widget_item: QTreeWidgetItem, outline_item: OutlineItem):
         """设置项目样式"""
-        font = QFont()
-        
-        if outline_item.item_type == "heading":
-            if outline_item.level <= 2:
-                font.setBold(True)
-                font.setPointSize(10)
-            elif outline_item.level <= 4:
-                font.setPointSize(9)
-            else:
-                font.setPointSize(8)
-        elif outline_item.item_type == "list":
-            font.setItalic(True)
-            font.setPointSize(8)
-        elif outline_item.item_type == "code_block":
-            font.setFamily("Courier")
-            font.setPointSize(8)
+        item_type = outline_item.item_type
+        if item_type == "heading":
+            level = outline_item.level
+            key = ("heading", 2 if level <= 2 else 4 if level <= 4 else 6)
+        elif item_type == "list" or item_type == "code_block":
+            key = (item_type, 0)
+        else:
+            key = (None, 0)
         
-        widget_item.setFont(0, font)
+        widget_item.setFont(0, self._font_cache[key])
     
     def highlight_current_line(self, line_number: int):
         """高亮当前行"""
         self.current_line = line_number
         
         # 清除之前的高亮
-        for i in range(self.topLevelItemCount()):
-            self._clear_highlight(self.topLevelItem(i))
+        self._clear_highlight()
         
         # 查找并高亮当前行对应的项目
         target_item = self._find_item_by_line(line_number)
@@ -415,52 +545,24 @@ class OutlineTreeWidget(QTreeWidget):
             target_item.setBackground(0, self.palette().highlight())
             target_item.setBackground(1, self.palette().highlight())
             self.scrollToItem(target_item)
+            self._last_highlighted = target_item
     
-    def _clear_highlight(self, item: Optional[QTreeWidgetItem]):
-        """清除高亮"""
+    def _clear_highlight(self):
+        """清除上次的高亮"""
+        item = self._last_highlighted
         if item is None:
             return
         
         item.setBackground(0, self.palette().base())
         item.setBackground(1, self.palette().base())
-        
-        for i in range(item.childCount()):
-            child = item.child(i)
-            if child:
-                self._clear_highlight(child)
+        self._last_highlighted = None
     
     def _find_item_by_line(self, line_number: int) -> Optional[QTreeWidgetItem]:
-        """根据行号查找项目"""
-        def search_item(item: QTreeWidgetItem) -> Optional[QTreeWidgetItem]:
-            item_line = item.data(0, Qt.ItemDataRole.UserRole)
-            if item_line and item_line <= line_number:
-                # 检查是否是最接近的项目
-                closest = item
-                for i in range(item.childCount()):
-                    child = item.child(i)
-                    if child:
-                        child_result = search_item(child)
-                        if child_result:
-                            child_line = child_result.data(0, Qt.ItemDataRole.UserRole)
-                            if child_line and child_line <= line_number:
-                                closest = child_result
-                return closest
+        """根据行号查找项目（行号不超过目标行的最后一个项目）"""
+        index = bisect_right(self._line_numbers, line_number) - 1
+        if index < 0:
             return None
-        
-        best_match = None
-        best_line = 0
-        
-        for i in range(self.topLevelItemCount()):
-            item = self.topLevelItem(i)
-            if item:
-                result = search_item(item)
-                if result:
-                    result_line = result.data(0, Qt.ItemDataRole.UserRole)
-                    if result_line and result_line <= line_number and result_line > best_line:
-                        best_match = result
-                        best_line = result_line
-        
-        return best_match
+        return self._line_items[index]
 
 
 class DocumentOutlineNavigator(QWidget):
@@ -478,6 +580,10 @@ class DocumentOutlineNavigator(QWidget):
         self.current_file_path = None  # 添加文件路径支持
         self.auto_refresh = True
         self.refresh_timer = QTimer()
+        # 上次解析的内容指纹，内容未变化时跳过重新解析
+        self._last_content_hash = None
+        # 上次Markdown解析的 (行列表, 扁平项目列表)，用于增量解析
+        self._markdown_cache = None
         self.init_ui()
         self.setup_timer()
     
@@ -497,7 +603,7 @@ class DocumentOutlineNavigator(QWidget):
         
         # 刷新按钮
         self.refresh_btn = QPushButton("刷新")
-        self.refresh_btn.clicked.connect(self.refresh_outline)
+        self.refresh_btn.clicked.connect(lambda: self.refresh_outline(force=True))
         control_layout.addWidget(self.refresh_btn)
         
         # 自动刷新复选框
@@ -540,6 +646,10 @@ class DocumentOutlineNavigator(QWidget):
     
     def update_content(self, content: str, doc_type: Optional[str] = None, file_path: Optional[str] = None):
         """更新文档内容"""
+        # 内容未变化时无需重新安排刷新（已解析的大纲仍然有效）
+        if not doc_type and file_path == self.current_file_path and content == self.current_content:
+            return
+        
         self.current_content = content
         self.current_file_path = file_path
         
@@ -555,31 +665,48 @@ class DocumentOutlineNavigator(QWidget):
             self.doc_type_combo.setCurrentIndex(index)
         
         if self.auto_refresh:
-            # 延迟刷新，避免频繁更新
-            self.refresh_timer.start(500)
-    
-    def refresh_outline(self):
+            # 延迟刷新，避免频繁更新；文档越大延迟越长
+            self.refresh_timer.start(self._refresh_delay())
+    
+    def _refresh_delay(self) -> int:
+        """根据文档大小计算自适应刷新延迟（毫秒）"""
+        length = len(self.current_content)
+        if length < 50_000:
+            return 500
+        if length < 500_000:
+            return 1000
+        return 2000
+    
+    def _content_hash(self):
+        """计算当前内容指纹"""
+        return (hash(self.current_content), self.current_doc_type, self.current_file_path)
+    
+    def refresh_outline(self, force: bool = False):
         """刷新大纲"""
         # 对于Word文档，即使内容为空也可能有结构
         if not self.current_content.strip() and self.current_doc_type != "word":
-            self.outline_tree.clear()
+            self.outline_tree.update_outline([])
             self.stats_label.setText("统计: 0 个项目")
+            self._last_content_hash = None
+            self._markdown_cache = None
+            return
+        
+        content_hash = self._content_hash()
+        if not force and content_hash == self._last_content_hash:
             return
         
         try:
             # 解析文档
-            outline_items = self.parser.parse_document(
-                self.current_content, 
-                self.current_doc_type,
-                self.current_file_path
-            )
+            outline_items = self._parse_current_document()
             
             # 更新树形控件
             self.outline_tree.update_outline(outline_items)
+            self._last_content_hash = content_hash
             
-            # 更新统计信息
-            total_items = self._count_items(outline_items)
-            headings = sum(1 for item in self._flatten_items(outline_items) if item.item_type == "heading")
+            # 更新统计信息（一次扁平化同时得到总数和标题数）
+            flattened = self._flatten_items(outline_items)
+            total_items = len(flattened)
+            headings = sum(1 for item in flattened if item.item_type == "heading")
             self.stats_label.setText(f"统计: {total_items} 个项目, {headings} 个标题")
             
             # 发送信号
@@ -589,30 +716,47 @@ class DocumentOutlineNavigator(QWidget):
             print(f"刷新大纲失败: {e}")
             QMessageBox.warning(self, "警告", f"解析文档失败: {str(e)}")
     
+    def _parse_current_document(self) -> List[OutlineItem]:
+        """解析当前文档，Markdown文档尽量基于上次结果增量解析"""
+        if self.current_doc_type != "markdown":
+            self._markdown_cache = None
+            return self.parser.parse_document(
+                self.current_content, 
+                self.current_doc_type,
+                self.current_file_path
+            )
+        
+        lines = self.current_content.split('\n')
+        has_fence = '```' in self.current_content
+        if self._markdown_cache and not has_fence:
+            items = self.parser.parse_markdown_incremental(*self._markdown_cache, lines)
+        else:
+            items = self.parser.parse_markdown_lines(lines)
+        
+        # 代码块状态跨行传递，含围栏的文档不做增量解析
+        self._markdown_cache = None if has_fence else (lines, items)
+        return self.parser.build_hierarchy(items)
+    
     def filter_outline(self, text: str):
         """过滤大纲"""
-        def filter_item(item: QTreeWidgetItem, filter_text: str) -> bool:
-            # 检查当前项是否匹配
-            matches = filter_text.lower() in item.text(0).lower()
-            
-            # 检查子项
-            child_matches = False
-            for i in range(item.childCount()):
-                child = item.child(i)
-                if child and filter_item(child, filter_text):
-                    child_matches = True
-            
-            # 显示/隐藏项目
-            visible = matches or child_matches or not filter_text
+        filter_text = text.lower()
+        
+        # 前序收集所有项目
+        ordered_items = []
+        stack = [self.outline_tree.topLevelItem(i) for i in range(self.outline_tree.topLevelItemCount())]
+        while stack:
+            item = stack.pop()
+            ordered_items.append(item)
+            stack.extend(item.child(i) for i in range(item.childCount()))
+        
+        # 逆序处理，保证子项的可见性先于父项确定
+        for item in reversed(ordered_items):
+            visible = (
+                not filter_text
+                or filter_text in item.data(0, _FILTER_TEXT_ROLE)
+                or any(not item.child(i).isHidden() for i in range(item.childCount()))
+            )
             item.setHidden(not visible)
-            
-            return visible
-        
-        # 过滤所有顶级项目
-        for i in range(self.outline_tree.topLevelItemCount()):
-            item = self.outline_tree.topLevelItem(i)
-            if item:
-                filter_item(item, text)
     
     def toggle_auto_refresh(self, enabled: bool):
         """切换自动刷新"""
@@ -631,19 +775,14 @@ class DocumentOutlineNavigator(QWidget):
         """高亮当前行"""
         self.outline_tree.highlight_current_line(line_number)
     
-    def _count_items(self, items: List[OutlineItem]) -> int:
-        """计算项目总数"""
-        count = len(items)
-        for item in items:
-            count += self._count_items(item.children)
-        return count
-    
     def _flatten_items(self, items: List[OutlineItem]) -> List[OutlineItem]:
-        """扁平化项目列表"""
-        result = []
-        for item in items:
+        """扁平化项目列表（迭代前序遍历，避免深层大纲递归）"""
+        result: List[OutlineItem] = []
+        stack = list(reversed(items))
+        while stack:
+            item = stack.pop()
             result.append(item)
-            result.extend(self._flatten_items(item.children))
+            stack.extend(reversed(item.children))
         return result
     
     def get_outline_statistics(self) -> Dict[str, Any]:
@@ -1,20 +1,59 @@
 """
 查找替换对话框
 """
+import re
+
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
-    QPushButton, QCheckBox, QTextEdit, QMessageBox
+    QPushButton, QCheckBox, QTextEdit, QMessageBox, QProgressDialog
 )
+from PyQt6.QtCore import Qt, QThread, pyqtSignal
 from PyQt6.QtGui import QTextCursor
 
 
+class ReplaceWorker(QThread):
+    """全部替换工作线程"""
+    
+    replace_done = pyqtSignal(str, int)  # (新内容, 替换次数)
+    
+    def __init__(self, pattern: re.Pattern, replace_text: str, content: str):
+        super().__init__()
+        self.pattern = pattern
+        self.replace_text = replace_text
+        self.content = content
+        self._canceled = False
+    
+    def cancel(self):
+        """取消替换（结果将被丢弃）"""
+        self._canceled = True
+    
+    def is_canceled(self) -> bool:
+        """是否已取消"""
+        return self._canceled
+    
+    def run(self):
+        """执行替换"""
+        replace_text = self.replace_text
+        new_content, count = self.pattern.subn(lambda match: replace_text, self.content)
+        self.replace_done.emit(new_content, count)
+
+
 class FindReplaceDialog(QDialog):
     """查找替换对话框"""
     
+    # 超过该字符数的文档在后台线程中执行全部替换
+    ASYNC_REPLACE_THRESHOLD = 1_000_000
+    
     def __init__(self, text_edit: QTextEdit, parent=None):
         super().__init__(parent)
         self.text_edit = text_edit
         self.last_found_pos = 0
+        self._pattern_cache = {}
+        self._replace_worker = None
+        self._progress_dialog = None
+        # 文档纯文本缓存，文档内容变化时失效
+        self._cached_content = None
+        self.text_edit.document().contentsChanged.connect(self._invalidate_content_cache)
         self.setup_ui()
     
     def setup_ui(self):
@@ -89,26 +128,25 @@ class FindReplaceDialog(QDialog):
         if not find_text:
             return
         
-        content = self.text_edit.toPlainText()
+        content = self._get_content()
+        pattern = self._get_pattern(find_text, self.case_sensitive_cb.isChecked())
         
-        if not self.case_sensitive_cb.isChecked():
-            content = content.lower()
-            find_text = find_text.lower()
+        # 从当前位置开始查找，直接在原文上匹配，无需生成小写副本
+        match = pattern.search(content, self.last_found_pos)
         
-        # 从当前位置开始查找
-        pos = content.find(find_text, self.last_found_pos)
-        
-        if pos == -1:
+        if match is None:
             # 从头开始查找
-            pos = content.find(find_text, 0)
-            if pos == -1:
+            match = pattern.search(content)
+            if match is None:
                 QMessageBox.information(self, "查找", "未找到指定文本")
                 return
         
+        pos = match.start()
+        
         # 选中找到的文本
         cursor = self.text_edit.textCursor()
         cursor.setPosition(pos)
-        cursor.setPosition(pos + len(self.find_edit.text()), QTextCursor.MoveMode.KeepAnchor)
+        cursor.setPosition(match.end(), QTextCursor.MoveMode.KeepAnchor)
         self.text_edit.setTextCursor(cursor)
         
         # 更新查找位置
@@ -132,29 +170,87 @@ class FindReplaceDialog(QDialog):
         if not find_text:
             return
         
-        content = self.text_edit.toPlainText()
+        content = self._get_content()
+        pattern = self._get_pattern(find_text, self.case_sensitive_cb.isChecked())
         
-        # 根据选项处理
-        if self.case_sensitive_cb.isChecked():
-            new_content = content.replace(find_text, replace_text)
-        else:
-            # 不区分大小写的替换
-            import re
-            pattern = re.compile(re.escape(find_text), re.IGNORECASE)
-            new_content = pattern.sub(replace_text, content)
-        
-        # 计算替换次数
-        if self.case_sensitive_cb.isChecked():
-            count = content.count(find_text)
-        else:
-            count = len(re.findall(re.escape(find_text), content, re.IGNORECASE))
+        # 大文档在后台线程中替换，避免界面卡顿
+        if len(content) >= self.ASYNC_REPLACE_THRESHOLD:
+            self._start_async_replace(pattern, replace_text, content)
+            return
         
+        # 一次扫描同时完成替换和计数；替换文本按字面处理
+        new_content, count = pattern.subn(lambda match: replace_text, content)
+        self._apply_replace_result(new_content, count)
+    
+    def _start_async_replace(self, pattern: re.Pattern, replace_text: str, content: str):
+        """启动后台替换"""
+        # 已取消的替换仍会在后台运行到结束，期间不能启动新的替换
+        if self._replace_worker is not None and self._replace_worker.isRunning():
+            QMessageBox.information(self, "替换", "上一次替换仍在进行，请稍后再试")
+            return
+        
+        self._progress_dialog = QProgressDialog("替换中…", "取消", 0, 0, self)
+        self._progress_dialog.setWindowTitle("替换")
+        self._progress_dialog.setWindowModality(Qt.WindowModality.ApplicationModal)
+        self._progress_dialog.setMinimumDuration(0)
+        
+        self._replace_worker = ReplaceWorker(pattern, replace_text, content)
+        self._replace_worker.replace_done.connect(self._on_async_replace_finished)
+        self._progress_dialog.canceled.connect(self._replace_worker.cancel)
+        self._replace_worker.start()
+        self._progress_dialog.show()
+    
+    def _on_async_replace_finished(self, new_content: str, count: int):
+        """后台替换完成"""
+        worker = self._replace_worker
+        # 关闭进度框会触发 canceled 信号，先断开
+        self._progress_dialog.canceled.disconnect()
+        self._progress_dialog.close()
+        self._progress_dialog = None
+        
+        if worker.is_canceled():
+            return
+        
+        # 替换期间文档被修改过，结果已过期
+        if self._cached_content is not worker.content:
+            QMessageBox.warning(self, "替换", "文档在替换期间已被修改，请重新执行替换")
+            return
+        
+        self._apply_replace_result(new_content, count)
+    
+    def _apply_replace_result(self, new_content: str, count: int):
+        """写回替换结果"""
         if count > 0:
-            self.text_edit.setPlainText(new_content)
+            # 作为一次可撤销的编辑写回，保留文档的撤销历史
+            cursor = self.text_edit.textCursor()
+            cursor.beginEditBlock()
+            cursor.select(QTextCursor.SelectionType.Document)
+            cursor.insertText(new_content)
+            cursor.endEditBlock()
             QMessageBox.information(self, "替换", f"已替换 {count} 个匹配项")
         else:
             QMessageBox.information(self, "替换", "没有找到匹配项")
     
+    def _invalidate_content_cache(self):
+        """文档内容变化时清除缓存"""
+        self._cached_content = None
+    
+    def _get_content(self) -> str:
+        """获取（缓存的）文档纯文本"""
+        if self._cached_content is None:
+            self._cached_content = self.text_edit.toPlainText()
+        return self._cached_content
+    
+    def _get_pattern(self, find_text: str, case_sensitive: bool) -> re.Pattern:
+        """获取（缓存的）查找正则"""
+        key = (find_text, case_sensitive)
+        pattern = self._pattern_cache.get(key)
+        if pattern is None:
+            flags = 0 if case_sensitive else re.IGNORECASE
+            pattern = re.compile(re.escape(find_text), flags)
+            self._pattern_cache[key] = pattern
+        return pattern
+    
     def showEvent(self, event):
         """显示事件"""
         super().showEvent(event)
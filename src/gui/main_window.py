@@ -4,58 +4,443 @@ AI文档管理系统桌面客户端
 """
 import sys
 import os
-import subprocess
-import threading
+import logging
+import json
 import time
-from typing import Optional, Any, cast
+import functools
+from typing import Optional, Any, Callable, Dict, cast
 from pathlib import Path
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QLabel, QPushButton, QTextEdit,
+    QLabel, QPushButton, QPlainTextEdit,
     QStatusBar, QTabWidget, QSplitter, QMessageBox, QMenuBar, QMenu,
-    QFileDialog, QInputDialog, QProgressDialog
+    QFileDialog, QInputDialog
 )
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QThread
-from PyQt6.QtGui import QAction, QFont
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QThread, QObject, QUrl, QEvent, QProcess, QIODevice
+from PyQt6.QtGui import QAction, QFont, QTextCursor, QPixmapCache
+from PyQt6.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply
 import requests
 
+# 项目路径
+_HERE = Path(__file__).resolve()
+_PROJECT_ROOT = _HERE.parents[2]
+_VENV_PY = _PROJECT_ROOT / "aidocs-env" / "Scripts" / "python.exe"
+_API_SCRIPT = _HERE.parents[1] / "api" / "main.py"
+_API_LOG = _PROJECT_ROOT / "logs" / "api.log"
+
 # 添加项目根目录到Python路径
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(str(_PROJECT_ROOT))
 
 from config.settings import Settings
 from src.gui.document_outline_navigator import DocumentOutlineNavigator
-from src.gui.document_editor import DocumentEditor
-from src.core.ai_service import AIService
-from src.core.word_parser import WordDocumentParser
 
 # 常量定义
 APP_NAME = "AI文档管理系统"
 APP_VERSION = "1.0.0"
 
+# 全局图片缓存上限（KB），同一张图片在多个视图中只解码一次
+PIXMAP_CACHE_LIMIT = 51200
+
+# API状态轮询间隔（毫秒）：状态稳定时逐步放宽，状态变化时恢复为最短间隔
+API_POLL_MIN_INTERVAL = 5000
+API_POLL_DEFAULT_INTERVAL = 30000
+API_POLL_MAX_INTERVAL = 300000
+
+# AI服务可用性检查结果缓存时间（秒）
+AI_AVAILABILITY_TTL = 30
+
+# Word增强功能说明
+_WORD_ENHANCED_DETAILS = "\n".join([
+    "📷 图片处理功能:",
+    "  • 自动提取Word文档中的图片",
+    "  • 支持PNG、JPEG、GIF等格式",
+    "  • 转换为Base64格式用于Markdown显示",
+    "  • 保存图片到临时目录供查看",
+    "",
+    "📊 复杂表格支持:",
+    "  • 保持表格结构和格式",
+    "  • 支持合并单元格的处理",
+    "  • 识别表头和数据行",
+    "  • 保持单元格对齐方式",
+    "  • 提取表格背景色和文字颜色",
+    "",
+    "🎨 样式保持功能:",
+    "  • 识别段落样式信息",
+    "  • 保持字体、字号、颜色",
+    "  • 处理粗体、斜体、下划线",
+    "  • 保持段落对齐和缩进",
+    "  • 转换为对应的Markdown格式",
+    "",
+    "✨ 智能解析特性:",
+    "  • 多级标题层次识别",
+    "  • 项目符号和编号列表",
+    "  • 引用和特殊段落样式",
+    "  • 文档元数据提取",
+    "  • 结构化内容组织"
+])
+
+_WORD_ENHANCED_UNAVAILABLE = "\n".join([
+    "⚠️ 增强功能不可用",
+    "",
+    "可能的原因:",
+    "  • 缺少必要的依赖库 (Pillow, lxml)",
+    "  • 增强解析器模块加载失败",
+    "",
+    "解决方案:",
+    "  1. 确保已安装所有依赖: pip install Pillow lxml",
+    "  2. 重启应用程序",
+    "  3. 检查enhanced_word_parser.py是否存在"
+])
+
+_WORD_USAGE_TIPS = "\n".join([
+    "",
+    "📖 使用建议:",
+    "  • 优先使用.docx格式的Word文档",
+    "  • 使用标准的内置样式（标题1、标题2等）",
+    "  • 避免过于复杂的嵌套表格",
+    "  • 图片建议使用常见格式（PNG、JPEG）",
+    "",
+    "💡 提示: 通过菜单'Word处理 → 测试Word功能'可以运行完整测试"
+])
+
+# 演示文档内容
+_DEMO_CONTENT = """# AI文档管理系统 - 完整功能演示
+
+## 🎯 系统简介
+AI文档管理系统是一个基于PyQt6的智能文档管理平台，集成了Word处理、AI助手、大纲导航等核心功能。
+
+## 🚀 主要功能
+
+### 1. 文档编辑器
+- **多标签页管理**: 支持同时编辑多个文档
+- **语法高亮**: Markdown语法高亮显示
+- **自动保存**: 防止数据丢失
+- **查找替换**: 快速定位和修改内容
+
+### 2. Word文档支持
+- **读取Word文档**: 支持.docx和.doc格式
+- **转换功能**: Word ↔ Markdown互转
+- **结构保持**: 保留文档层次结构
+- **格式处理**: 处理复杂格式和样式
+
+### 3. 大纲导航
+- **实时更新**: 文档结构自动解析
+- **快速跳转**: 点击大纲项目直接跳转
+- **多级支持**: 支持多级标题结构
+- **智能识别**: 自动识别标题和章节
+
+### 4. AI智能助手
+- **大纲生成**: 根据内容自动生成大纲
+- **内容建议**: 提供写作建议和改进
+- **文档分析**: 智能分析文档结构
+- **写作辅助**: 提供创作灵感和优化建议
+
+### 5. 模板管理
+- **模板库**: 丰富的文档模板
+- **分类管理**: 按类型组织模板
+- **自定义模板**: 创建个人模板
+- **导入导出**: 模板的批量管理
+
+## 📊 技术架构
+
+### 前端技术
+- **GUI框架**: PyQt6 - 现代化桌面应用框架
+- **界面设计**: 响应式布局，支持多分辨率
+- **交互体验**: 直观的用户界面和操作流程
+
+### 后端技术
+- **文档处理**: python-docx - 专业Word文档处理
+- **AI集成**: OpenAI兼容API - 智能功能支持
+- **搜索引擎**: Whoosh - 全文搜索功能
+- **数据存储**: SQLite - 轻量级数据库
+
+### 核心特性
+- **模块化设计**: 松耦合的架构设计
+- **异常处理**: 完善的错误处理机制
+- **性能优化**: 高效的文档处理算法
+- **扩展性**: 支持功能模块的灵活扩展
+
+## 🎮 使用指南
 
-class APIClient:
-    """API客户端"""
+### 基本操作
+1. **新建文档**: 文件 → 新建文档
+2. **打开文档**: 文件 → 打开文档
+3. **保存文档**: Ctrl+S 或点击保存按钮
+4. **编辑内容**: 在右侧编辑器中输入内容
+
+### 高级功能
+1. **Word处理**: 文件 → 打开Word文档
+2. **大纲导航**: 查看 → 显示大纲导航
+3. **AI助手**: 使用AI菜单中的各项功能
+4. **模板管理**: 模板 → 模板管理器
+
+### 快捷键
+- **Ctrl+N**: 新建文档
+- **Ctrl+O**: 打开文档
+- **Ctrl+S**: 保存文档
+- **Ctrl+F**: 查找内容
+- **F5**: 刷新界面
+
+## 📈 开发进度
+
+### 已完成功能 ✅
+- [x] 核心文档编辑器
+- [x] Word文档处理
+- [x] 大纲导航系统
+- [x] AI服务集成
+- [x] 模板管理系统
+- [x] 用户界面优化
+
+### 开发中功能 🔄
+- [ ] 全文搜索引擎
+- [ ] 文档版本控制
+- [ ] 协作编辑功能
+- [ ] 云端同步
+
+### 规划中功能 📋
+- [ ] 插件系统
+- [ ] 主题定制
+- [ ] 多语言支持
+- [ ] 移动端适配
+
+## 💡 使用建议
+
+1. **初次使用**: 建议从简单的Markdown文档开始
+2. **Word处理**: 大文档建议先备份再处理
+3. **AI功能**: 需要配置API密钥才能使用
+4. **模板使用**: 选择合适的模板可以提高效率
+
+---
+
+*这是一个完整的演示文档，展示了系统的所有核心功能。您可以在左侧大纲导航中查看文档结构，尝试编辑内容，体验各项功能。*
+"""
+
+
+class APIClient(QObject):
+    """API客户端（基于QNetworkAccessManager的异步请求）"""
+    
+    # 请求结果信号
+    health_ready = pyqtSignal(dict)
+    documents_ready = pyqtSignal(object)
+    
+    # 健康检查结果缓存时间（秒）
+    HEALTH_CACHE_TTL = 10
+    # 请求超时时间（毫秒）
+    REQUEST_TIMEOUT = 5000
+    
+    def __init__(self, base_url="http://127.0.0.1:8000", parent=None):
+        super().__init__(parent)
+        self._health_cache: Optional[tuple] = None  # (时间戳, 结果)
+        self._health_reply: Optional[QNetworkReply] = None  # 进行中的健康检查请求
+        self.base_url = ""
+        self._health_url = QUrl()
+        self._docs_url = QUrl()
+        self.set_base_url(base_url)
+        self._network = QNetworkAccessManager(self)
+        self._network.setTransferTimeout(self.REQUEST_TIMEOUT)
     
-    def __init__(self, base_url="http://127.0.0.1:8000"):
-        self.base_url = base_url
+    def set_base_url(self, base_url: str):
+        """设置API地址并重新生成各接口URL"""
+        self.base_url = base_url.rstrip('/')
+        self._health_url = QUrl(f"{self.base_url}/health")
+        self._docs_url = QUrl(f"{self.base_url}/api/v1/documents")
+        self.invalidate()
+    
+    def request_health(self, callback: Callable[[Optional[int], Any, str], None]):
+        """立即请求健康检查接口（不使用缓存），完成后调用 callback(HTTP状态码, 响应数据, 错误信息)"""
+        reply = self._network.get(QNetworkRequest(self._health_url))
+        reply.finished.connect(lambda: self._on_request_health_reply(reply, callback))
+    
+    def _on_request_health_reply(self, reply: QNetworkReply, callback: Callable[[Optional[int], Any, str], None]):
+        """健康检查接口响应"""
+        status_code = reply.attribute(QNetworkRequest.Attribute.HttpStatusCodeAttribute)
+        data = None
+        error = ""
+        if status_code is None:
+            # 未收到HTTP响应（连接失败、超时等）
+            error = reply.errorString()
+        elif status_code == 200:
+            try:
+                data = json.loads(reply.readAll().data().decode('utf-8'))
+            except Exception as e:
+                error = str(e)
+        reply.deleteLater()
+        callback(status_code, data, error)
+    
+    def invalidate(self):
+        """清除健康检查缓存，服务状态变化后调用"""
+        self._health_cache = None
+        # 进行中的请求结果已过期，到达后丢弃
+        self._health_reply = None
     
     def health_check(self):
-        """健康检查"""
+        """健康检查，结果通过 health_ready 信号返回（HEALTH_CACHE_TTL 秒内复用）"""
+        if self._health_cache and time.monotonic() - self._health_cache[0] < self.HEALTH_CACHE_TTL:
+            self.health_ready.emit(self._health_cache[1])
+            return
+        
+        # 已有请求在进行中时不再重复发起，结果到达后统一通知
+        if self._health_reply is not None:
+            return
+        
+        reply = self._network.get(QNetworkRequest(self._health_url))
+        self._health_reply = reply
+        reply.finished.connect(lambda: self._on_health_reply(reply))
+    
+    def _on_health_reply(self, reply: QNetworkReply):
+        """健康检查响应"""
+        if reply is not self._health_reply:
+            reply.deleteLater()
+            return
+        self._health_reply = None
+        
+        health = self._read_json(reply, "API健康检查失败")
+        if not isinstance(health, dict):
+            health = {"status": "error"}
+        
+        self._health_cache = (time.monotonic(), health)
+        self.health_ready.emit(health)
+    
+    def get_documents(self):
+        """获取文档列表，结果通过 documents_ready 信号返回"""
+        reply = self._network.get(QNetworkRequest(self._docs_url))
+        reply.finished.connect(lambda: self._on_documents_reply(reply))
+    
+    def _on_documents_reply(self, reply: QNetworkReply):
+        """文档列表响应"""
+        documents = self._read_json(reply, "获取文档列表失败")
+        self.documents_ready.emit(documents if documents is not None else [])
+    
+    def _read_json(self, reply: QNetworkReply, error_prefix: str) -> Any:
+        """读取响应JSON，失败时返回None"""
         try:
-            response = requests.get(f"{self.base_url}/health", timeout=5)
-            return response.json()
+            if reply.error() != QNetworkReply.NetworkError.NoError:
+                raise ConnectionError(reply.errorString())
+            return json.loads(reply.readAll().data().decode('utf-8'))
         except Exception as e:
-            print(f"API健康检查失败: {e}")
-            return {"status": "error"}
+            print(f"{error_prefix}: {e}")
+            return None
+        finally:
+            reply.deleteLater()
+
+
+class ApiBootWorker(QThread):
+    """API服务启动检查线程，轮询健康检查接口直到服务就绪或超时"""
     
-    def get_documents(self):
-        """获取文档列表"""
+    boot_finished = pyqtSignal(bool, str)  # (是否成功, 失败原因)
+    
+    HEALTH_URL = "http://127.0.0.1:8000/health"
+    
+    def __init__(self, timeout: float = 10.0, interval: float = 0.2, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self.timeout = timeout
+        self.interval = interval
+        self._canceled = False
+    
+    def cancel(self):
+        """取消检查，线程在当前轮询结束后退出且不再发出结果"""
+        self._canceled = True
+    
+    def run(self):
+        """轮询健康检查"""
+        deadline = time.monotonic() + self.timeout
+        error = "健康检查超时"
+        # 轮询期间复用同一会话的连接
+        with requests.Session() as session:
+            while not self._canceled and time.monotonic() < deadline:
+                try:
+                    response = session.get(self.HEALTH_URL, timeout=0.5)
+                    if response.status_code == 200:
+                        if not self._canceled:
+                            self.boot_finished.emit(True, "")
+                        return
+                    error = f"健康检查失败: HTTP {response.status_code}"
+                except Exception as e:
+                    error = str(e)
+                time.sleep(self.interval)
+        
+        if not self._canceled:
+            self.boot_finished.emit(False, error)
+
+
+class FileLoadWorker(QThread):
+    """文本文件加载线程，分块读取文件内容"""
+    
+    chunk = pyqtSignal(str)
+    done = pyqtSignal()
+    failed = pyqtSignal(str)
+    
+    # 每次读取的字符数
+    CHUNK_SIZE = 64 * 1024
+    
+    def __init__(self, path: str, encoding: str = 'utf-8', parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self.path = path
+        self.encoding = encoding
+        self._canceled = False
+    
+    def cancel(self):
+        """取消加载，线程读完当前块后退出且不再发出信号"""
+        self._canceled = True
+    
+    def run(self):
+        """逐块读取文件"""
+        try:
+            with open(self.path, 'r', encoding=self.encoding) as f:
+                while not self._canceled:
+                    data = f.read(self.CHUNK_SIZE)
+                    if not data:
+                        break
+                    self.chunk.emit(data)
+        except Exception as e:
+            if not self._canceled:
+                self.failed.emit(str(e))
+            return
+        if not self._canceled:
+            self.done.emit()
+
+
+class MarkdownToWordWorker(QThread):
+    """Markdown转Word线程"""
+    
+    converted = pyqtSignal(str, int)  # (文件路径, 文件大小)
+    failed = pyqtSignal(str)
+    
+    def __init__(self, converter_class: Any, content: str, file_path: str):
+        super().__init__()
+        self.converter_class = converter_class
+        self.content = content
+        self.file_path = file_path
+    
+    def run(self):
+        """执行转换并保存"""
+        try:
+            converter = self.converter_class()
+            converter.convert_markdown_to_word(self.content)
+            converter.save_document(self.file_path)
+            self.converted.emit(self.file_path, os.path.getsize(self.file_path))
+        except Exception as e:
+            self.failed.emit(str(e))
+
+
+class TemplateStatsWorker(QThread):
+    """模板统计线程"""
+    
+    stats_ready = pyqtSignal(object, dict)  # (元数据修改时间, 统计结果)
+    failed = pyqtSignal(str)
+    
+    def __init__(self, compute_stats: Callable[[], dict], metadata_mtime: Optional[float]):
+        super().__init__()
+        self.compute_stats = compute_stats
+        self.metadata_mtime = metadata_mtime
+    
+    def run(self):
+        """统计模板"""
         try:
-            response = requests.get(f"{self.base_url}/api/v1/documents", timeout=5)
-            return response.json()
+            stats = self.compute_stats()
+            self.stats_ready.emit(self.metadata_mtime, stats)
         except Exception as e:
-            print(f"获取文档列表失败: {e}")
-            return []
+            self.failed.emit(str(e))
 
 
 class DocumentWidget(QWidget):
@@ -64,58 +449,238 @@ class DocumentWidget(QWidget):
     # 定义信号
     content_changed = pyqtSignal(str)
     
+    # 文本变化信号的防抖间隔（毫秒）
+    CHANGE_DEBOUNCE_INTERVAL = 200
+    
     def __init__(self):
         super().__init__()
-        self.text_edit: QTextEdit = QTextEdit()
+        self.text_edit: QPlainTextEdit = QPlainTextEdit()
+        self._change_timer = QTimer(self)
+        # 最近一次获取的纯文本，文本变化后失效
+        self._last_content: Optional[str] = None
         self.init_ui()
     
     def init_ui(self):
         layout = QVBoxLayout()
         
         self.text_edit.setPlainText("欢迎使用AI文档管理系统！\n\n这是文档显示区域。")
-        # 连接文本变化信号
+        # 连接文本变化信号，连续输入时合并为一次通知
+        self._change_timer.setSingleShot(True)
+        self._change_timer.setInterval(self.CHANGE_DEBOUNCE_INTERVAL)
+        self._change_timer.timeout.connect(self.emit_content_changed)
         self.text_edit.textChanged.connect(self.on_text_changed)
         layout.addWidget(self.text_edit)
         
         self.setLayout(layout)
     
     def on_text_changed(self):
-        """文本变化时发出信号"""
-        content = self.text_edit.toPlainText()
-        self.content_changed.emit(content)
+        """文本变化时重新开始防抖计时"""
+        self._last_content = None
+        self._change_timer.start()
+    
+    def set_content(self, text: str):
+        """整体替换文档内容，只发出一次内容变化信号"""
+        self._change_timer.stop()
+        self.text_edit.blockSignals(True)
+        self.text_edit.setUpdatesEnabled(False)
+        self.text_edit.setPlainText(text)
+        self.text_edit.setUpdatesEnabled(True)
+        self.text_edit.blockSignals(False)
+        self._last_content = text
+        self.content_changed.emit(text)
+    
+    def begin_load(self):
+        """开始分块加载：清空内容，加载期间只读，暂停重绘、撤销记录和文本变化信号"""
+        self._change_timer.stop()
+        self.text_edit.setReadOnly(True)
+        self.text_edit.blockSignals(True)
+        self.text_edit.setUpdatesEnabled(False)
+        self.text_edit.setUndoRedoEnabled(False)
+        self.text_edit.clear()
+        self._last_content = None
+    
+    def append_text(self, text: str):
+        """在文档末尾追加文本"""
+        self.text_edit.moveCursor(QTextCursor.MoveOperation.End)
+        self.text_edit.insertPlainText(text)
+        self._last_content = None
+    
+    def end_load(self):
+        """结束分块加载并发出一次内容变化信号"""
+        self.text_edit.setReadOnly(False)
+        self.text_edit.setUndoRedoEnabled(True)
+        self.text_edit.setUpdatesEnabled(True)
+        self.text_edit.blockSignals(False)
+        self.text_edit.moveCursor(QTextCursor.MoveOperation.Start)
+        self.emit_content_changed()
+    
+    def content(self) -> str:
+        """获取文档纯文本（缓存）"""
+        if self._last_content is None:
+            self._last_content = self.text_edit.toPlainText()
+        return self._last_content
+    
+    def emit_content_changed(self):
+        """发出内容变化信号"""
+        self._last_content = self.text_edit.toPlainText()
+        self.content_changed.emit(self._last_content)
+
+
+def _requires_content(message: str):
+    """装饰器：当前文档为空时提示并跳过处理，否则把文档内容作为参数传入"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self):
+            content = self.get_current_document_content()
+            if not content or content.isspace():
+                QMessageBox.information(self, "提示", message)
+                return
+            return func(self, content)
+        return wrapper
+    return decorator
 
 
 class MainWindow(QMainWindow):
     """主窗口类"""
     
+    # 分块加载文档期间禁用的菜单项（方法名）
+    LOAD_BLOCKED_ACTIONS = ('new_document', 'open_document', 'save_document', 'save_as_word')
+    
+    # 菜单定义：(菜单名, 菜单项列表)
+    MENUS = [
+        ('文件', [
+            ('新建', [
+                ('新建文档', 'new_document'),
+                ('新建模板', 'new_template'),
+            ]),
+            None,
+            ('打开文档', 'open_document'),
+            ('打开Word文档', 'open_word_document'),
+            None,
+            ('保存文档', 'save_document'),
+            ('保存为Word', 'save_as_word'),
+            None,
+            ('API服务管理', [
+                ('启动API服务', 'start_api_service'),
+                ('停止API服务', 'stop_api_service'),
+                ('重启API服务', 'restart_api_service'),
+                None,
+                ('检查API状态', 'check_api_service_status'),
+                ('API配置', 'configure_api_service'),
+            ]),
+            None,
+            ('退出', 'close'),
+        ]),
+        ('模板', [
+            ('模板管理器', 'open_template_manager'),
+            None,
+            ('导入模板', 'import_template'),
+            ('导出模板', 'export_template'),
+            None,
+            ('模板统计', 'template_statistics'),
+        ]),
+        ('视图', [
+            ('刷新', 'refresh_data'),
+            None,
+            ('显示大纲导航', 'toggle_outline_navigator'),
+        ]),
+        ('AI助手', [
+            ('生成大纲', 'generate_outline'),
+            ('内容建议', 'get_content_suggestions'),
+            ('改进写作', 'improve_writing'),
+            None,
+            ('文档分析', 'analyze_document'),
+        ]),
+        ('Word处理', [
+            ('Word转Markdown', 'word_to_markdown'),
+            ('Markdown转Word', 'markdown_to_word'),
+            None,
+            ('查看增强功能', 'show_word_enhanced_features'),
+            ('测试Word功能', 'test_word_features'),
+        ]),
+        ('帮助', [
+            ('关于', 'about'),
+        ]),
+    ]
+    
     def __init__(self):
         super().__init__()
+        self.logger = logging.getLogger(__name__)
         self.settings = Settings()
-        self.api_client = APIClient()
+        self.api_client = APIClient(parent=self)
         self.template_manager_window: Optional[Any] = None
-        
-        # 初始化核心功能模块
-        self.ai_service = AIService()
-        self.word_parser = WordDocumentParser()
-        self.document_editor: Optional[DocumentEditor] = None
-        self.api_process: Optional[Any] = None  # API服务进程
-        self.api_thread: Optional[Any] = None   # API服务线程
+        self._template_manager: Optional[Any] = None  # 模板管理器，首次使用时创建
+        self._tm_stats_cache: Optional[tuple] = None  # (元数据修改时间, 统计结果)
+        self._tm_stats_worker: Optional[TemplateStatsWorker] = None
+        
+        # 核心功能模块在首次使用时再加载
+        self._ai_service: Optional[Any] = None
+        self._word_parser: Optional[Any] = None
+        self._word_support_probe: Optional[Callable[[], bool]] = None
+        self._ai_avail_cache: tuple = (0.0, False)  # (时间戳, 是否可用)
+        self._word_features_info: Optional[str] = None  # Word增强功能信息，首次查看时生成
+        self.document_editor: Optional[Any] = None
+        self.api_process: Optional[QProcess] = None  # API服务进程
+        self.api_thread: Optional[ApiBootWorker] = None   # API服务启动检查线程
+        self._file_load_worker: Optional[FileLoadWorker] = None  # 文本文件加载线程
+        self._menu_actions: Dict[str, QAction] = {}  # 方法名 -> 菜单项
+        self._open_dlg: Optional[QFileDialog] = None  # 打开/保存对话框，首次使用时创建并复用
+        self._save_dlg: Optional[QFileDialog] = None
+        self._md_word_worker: Optional[MarkdownToWordWorker] = None  # Markdown转Word线程
         
         # 初始化UI组件
         self.tab_widget: QTabWidget = QTabWidget()
         self.document_widget: DocumentWidget = DocumentWidget()
+        self._current_doc_widget: Optional[DocumentWidget] = None  # 当前标签页的文档组件
         self.outline_navigator: DocumentOutlineNavigator = DocumentOutlineNavigator()
         self.status_bar: QStatusBar = QStatusBar()
         self.api_status_label: QLabel = QLabel()
         self.edit_btn: QPushButton = QPushButton()
         self.save_btn: QPushButton = QPushButton()
         self.timer: QTimer = QTimer()
+        self._poll_interval = API_POLL_DEFAULT_INTERVAL
+        self._last_api_status: Optional[str] = None
         
         self.init_ui()
         self.init_timer()
         self.load_initial_data()
         self.setup_demo_content()
     
+    @property
+    def ai_service(self):
+        """AI服务（延迟加载）"""
+        if self._ai_service is None:
+            from src.core.ai_service import AIService
+            self._ai_service = AIService()
+        return self._ai_service
+    
+    def _ai_available(self) -> bool:
+        """AI服务是否可用（AI_AVAILABILITY_TTL 秒内复用检查结果）"""
+        now = time.monotonic()
+        checked_at, available = self._ai_avail_cache
+        if checked_at and now - checked_at < AI_AVAILABILITY_TTL:
+            return available
+        available = self.ai_service.is_available()
+        self._ai_avail_cache = (now, available)
+        return available
+    
+    @property
+    def word_parser(self):
+        """Word解析器（延迟加载）"""
+        if self._word_parser is None:
+            from src.core.word_parser import WordDocumentParser
+            self._word_parser = WordDocumentParser()
+            # 解析器类型在运行期间不变，可用性检查方法只需解析一次
+            self._word_support_probe = getattr(self._word_parser, 'is_word_support_available', None)
+        return self._word_parser
+    
+    def _word_support_available(self) -> bool:
+        """Word功能是否可用（解析器未提供检查方法时视为可用）"""
+        # 访问 word_parser 时加载解析器，同时确定可用性检查方法
+        if self.word_parser is None:
+            return False
+        return self._word_support_probe is None or self._word_support_probe()
+    
     def init_ui(self):
         """初始化用户界面"""
         self.setWindowTitle(APP_NAME)
@@ -154,161 +719,23 @@ class MainWindow(QMainWindow):
         """创建菜单栏"""
         # 使用cast确保类型安全
         menubar = cast(QMenuBar, self.menuBar())
-        
-        # 文件菜单
-        file_menu = cast(QMenu, menubar.addMenu('文件'))
-        
-        # 新建子菜单
-        new_menu = cast(QMenu, file_menu.addMenu('新建'))
-        
-        new_doc_action = QAction('新建文档', self)
-        new_doc_action.triggered.connect(self.new_document)
-        new_menu.addAction(new_doc_action)
-        
-        new_template_action = QAction('新建模板', self)
-        new_template_action.triggered.connect(self.new_template)
-        new_menu.addAction(new_template_action)
-        
-        file_menu.addSeparator()
-        
-        open_action = QAction('打开文档', self)
-        open_action.triggered.connect(self.open_document)
-        file_menu.addAction(open_action)
-        
-        # Word文档支持
-        open_word_action = QAction('打开Word文档', self)
-        open_word_action.triggered.connect(self.open_word_document)
-        file_menu.addAction(open_word_action)
-        
-        file_menu.addSeparator()
-        
-        save_action = QAction('保存文档', self)
-        save_action.triggered.connect(self.save_document)
-        file_menu.addAction(save_action)
-        
-        save_word_action = QAction('保存为Word', self)
-        save_word_action.triggered.connect(self.save_as_word)
-        file_menu.addAction(save_word_action)
-        
-        file_menu.addSeparator()
-        
-        # API服务管理子菜单
-        api_menu = cast(QMenu, file_menu.addMenu('API服务管理'))
-        
-        start_api_action = QAction('启动API服务', self)
-        start_api_action.triggered.connect(self.start_api_service)
-        api_menu.addAction(start_api_action)
-        
-        stop_api_action = QAction('停止API服务', self)
-        stop_api_action.triggered.connect(self.stop_api_service)
-        api_menu.addAction(stop_api_action)
-        
-        restart_api_action = QAction('重启API服务', self)
-        restart_api_action.triggered.connect(self.restart_api_service)
-        api_menu.addAction(restart_api_action)
-        
-        api_menu.addSeparator()
-        
-        check_api_action = QAction('检查API状态', self)
-        check_api_action.triggered.connect(self.check_api_service_status)
-        api_menu.addAction(check_api_action)
-        
-        api_config_action = QAction('API配置', self)
-        api_config_action.triggered.connect(self.configure_api_service)
-        api_menu.addAction(api_config_action)
-        
-        file_menu.addSeparator()
-        
-        exit_action = QAction('退出', self)
-        exit_action.triggered.connect(self.close)
-        file_menu.addAction(exit_action)
-        
-        # 模板菜单
-        template_menu = cast(QMenu, menubar.addMenu('模板'))
-        
-        template_manager_action = QAction('模板管理器', self)
-        template_manager_action.triggered.connect(self.open_template_manager)
-        template_menu.addAction(template_manager_action)
-        
-        template_menu.addSeparator()
-        
-        import_template_action = QAction('导入模板', self)
-        import_template_action.triggered.connect(self.import_template)
-        template_menu.addAction(import_template_action)
-        
-        export_template_action = QAction('导出模板', self)
-        export_template_action.triggered.connect(self.export_template)
-        template_menu.addAction(export_template_action)
-        
-        template_menu.addSeparator()
-        
-        template_stats_action = QAction('模板统计', self)
-        template_stats_action.triggered.connect(self.template_statistics)
-        template_menu.addAction(template_stats_action)
-        
-        # 视图菜单
-        view_menu = cast(QMenu, menubar.addMenu('视图'))
-        
-        refresh_action = QAction('刷新', self)
-        refresh_action.triggered.connect(self.refresh_data)
-        view_menu.addAction(refresh_action)
-        
-        view_menu.addSeparator()
-        
-        # 大纲导航切换
-        outline_action = QAction('显示大纲导航', self)
-        outline_action.triggered.connect(self.toggle_outline_navigator)
-        view_menu.addAction(outline_action)
-        
-        # AI助手菜单
-        ai_menu = cast(QMenu, menubar.addMenu('AI助手'))
-        
-        generate_outline_action = QAction('生成大纲', self)
-        generate_outline_action.triggered.connect(self.generate_outline)
-        ai_menu.addAction(generate_outline_action)
-        
-        content_suggestions_action = QAction('内容建议', self)
-        content_suggestions_action.triggered.connect(self.get_content_suggestions)
-        ai_menu.addAction(content_suggestions_action)
-        
-        improve_writing_action = QAction('改进写作', self)
-        improve_writing_action.triggered.connect(self.improve_writing)
-        ai_menu.addAction(improve_writing_action)
-        
-        ai_menu.addSeparator()
-        
-        analyze_document_action = QAction('文档分析', self)
-        analyze_document_action.triggered.connect(self.analyze_document)
-        ai_menu.addAction(analyze_document_action)
-        
-        # Word处理菜单
-        word_menu = cast(QMenu, menubar.addMenu('Word处理'))
-        
-        word_to_md_action = QAction('Word转Markdown', self)
-        word_to_md_action.triggered.connect(self.word_to_markdown)
-        word_menu.addAction(word_to_md_action)
-        
-        md_to_word_action = QAction('Markdown转Word', self)
-        md_to_word_action.triggered.connect(self.markdown_to_word)
-        word_menu.addAction(md_to_word_action)
-        
-        word_menu.addSeparator()
-        
-        # 增强功能菜单项
-        enhanced_features_action = QAction('查看增强功能', self)
-        enhanced_features_action.triggered.connect(self.show_word_enhanced_features)
-        word_menu.addAction(enhanced_features_action)
-        
-        test_word_action = QAction('测试Word功能', self)
-        test_word_action.triggered.connect(self.test_word_features)
-        word_menu.addAction(test_word_action)
-        
-        # 帮助菜单
-        help_menu = cast(QMenu, menubar.addMenu('帮助'))
-        
-        about_action = QAction('关于', self)
-        about_action.triggered.connect(self.about)
-        help_menu.addAction(about_action)
+        for title, entries in self.MENUS:
+            self._build_menu(cast(QMenu, menubar.addMenu(title)), entries)
+    
+    def _build_menu(self, menu: QMenu, entries: list):
+        """按菜单表填充菜单：None 为分隔线，(名称, 列表) 为子菜单，(名称, 方法名) 为菜单项"""
+        for entry in entries:
+            if entry is None:
+                menu.addSeparator()
+                continue
+            label, target = entry
+            if isinstance(target, list):
+                self._build_menu(cast(QMenu, menu.addMenu(label)), target)
+            else:
+                action = cast(QAction, menu.addAction(label))
+                self._menu_actions[target] = action
+                # 丢弃 triggered 的 checked 参数，槽函数签名固定为无参
+                action.triggered.connect(lambda checked=False, slot=getattr(self, target): slot())
     
     def create_left_panel(self) -> QWidget:
         """创建左侧面板"""
@@ -374,8 +801,9 @@ class MainWindow(QMainWindow):
         widget = QWidget()
         layout = QVBoxLayout()
         
-        # 创建标签页
+        # 创建标签页，记录当前的文档标签页供热点路径直接使用
         self.tab_widget = QTabWidget()
+        self.tab_widget.currentChanged.connect(self._on_tab_changed)
         
         # 文档查看标签页
         self.document_widget = DocumentWidget()
@@ -387,6 +815,11 @@ class MainWindow(QMainWindow):
         widget.setLayout(layout)
         return widget
     
+    def _on_tab_changed(self, index: int):
+        """当前标签页变化"""
+        widget = self.tab_widget.widget(index)
+        self._current_doc_widget = widget if isinstance(widget, DocumentWidget) else None
+    
     def create_status_bar(self):
         """创建状态栏"""
         self.status_bar = QStatusBar()
@@ -398,13 +831,61 @@ class MainWindow(QMainWindow):
     
     def init_timer(self):
         """初始化定时器"""
+        self.api_client.health_ready.connect(self.on_api_health)
         self.timer.timeout.connect(self.check_api_status)
-        self.timer.start(30000)  # 每30秒检查一次
+        self.timer.start(self._poll_interval)
+    
+    def _reset_api_polling(self):
+        """API服务状态可能发生变化，清除缓存并恢复快速轮询"""
+        self.api_client.invalidate()
+        self._poll_interval = API_POLL_MIN_INTERVAL
+        if self.timer.isActive():
+            self.timer.start(self._poll_interval)
+    
+    def _resume_api_polling(self):
+        """窗口重新可见：恢复轮询并立即刷新一次状态"""
+        if not self.timer.isActive():
+            self.timer.start(self._poll_interval)
+        self.check_api_status()
+    
+    def changeEvent(self, event):
+        """窗口状态变化：最小化时暂停API状态轮询"""
+        super().changeEvent(event)
+        if event.type() == QEvent.Type.WindowStateChange:
+            if self.isMinimized():
+                self.timer.stop()
+            elif self.isVisible():
+                self._resume_api_polling()
+    
+    def showEvent(self, event):
+        """窗口显示时恢复API状态轮询"""
+        super().showEvent(event)
+        self._resume_api_polling()
+    
+    def hideEvent(self, event):
+        """窗口隐藏时暂停API状态轮询"""
+        super().hideEvent(event)
+        self.timer.stop()
     
     def check_api_status(self):
-        """检查API状态"""
-        health = self.api_client.health_check()
-        if health.get('status') == 'healthy':
+        """检查API状态（异步，结果由 on_api_health 处理）"""
+        # 窗口不可见时无需刷新状态显示
+        if self.isHidden() or self.isMinimized():
+            return
+        self.api_client.health_check()
+    
+    def on_api_health(self, health: dict):
+        """更新API状态显示"""
+        # 自适应轮询：状态变化时缩短间隔，稳定时逐步放宽
+        status = health.get('status')
+        if status != self._last_api_status:
+            self._poll_interval = API_POLL_MIN_INTERVAL
+        else:
+            self._poll_interval = min(self._poll_interval * 2, API_POLL_MAX_INTERVAL)
+        self._last_api_status = status
+        self.timer.setInterval(self._poll_interval)
+        
+        if status == 'healthy':
             self.api_status_label.setText("API状态: 正常")
             self.api_status_label.setStyleSheet("color: green;")
         else:
@@ -425,40 +906,43 @@ class MainWindow(QMainWindow):
         except Exception as e:
             print(f"加载初始数据失败: {e}")
     
+    def _toast(self, message: str, timeout: int = 3000):
+        """在状态栏显示短暂的操作结果提示"""
+        self.status_bar.showMessage(message, timeout)
+    
+    def _show_error(self, message: str, e: Exception):
+        """记录异常详情并弹出错误提示"""
+        self.logger.exception(message)
+        QMessageBox.critical(self, "错误", f"{message}: {e}")
+    
     # 菜单动作方法
     def new_document(self):
         """新建文档"""
         try:
-            # 清空当前文档内容
-            self.document_widget.text_edit.clear()
-            self.document_widget.text_edit.setPlainText("# 新建文档\n\n请在此输入文档内容...")
-            
-            # 更新大纲导航
-            self.update_outline_content(self.get_current_document_content())
+            # 替换当前文档内容，内容变化信号会同步更新大纲导航
+            self.document_widget.set_content("# 新建文档\n\n请在此输入文档内容...")
             
-            # 更新状态栏
-            self.status_bar.showMessage("新建文档已创建")
+            self._toast("📝 新建文档已创建")
             
-            QMessageBox.information(self, "新建文档", 
-                                   "📝 新建文档已创建！\n\n"
-                                   "您可以开始编辑文档内容，所有功能都已准备就绪：\n"
-                                   "• 实时大纲导航\n"
-                                   "• AI智能助手\n"
-                                   "• Word文档支持\n"
-                                   "• 自动保存功能")
-                                   
         except Exception as e:
-            QMessageBox.critical(self, "错误", f"新建文档失败: {str(e)}")
+            self._show_error("新建文档失败", e)
     
     def open_document(self):
         """打开文档"""
         try:
-            file_path, _ = QFileDialog.getOpenFileName(
-                self, 
-                "打开文档", 
-                "", 
-                "所有支持的文档 (*.md *.txt *.docx *.doc);;Markdown文件 (*.md);;文本文件 (*.txt);;Word文档 (*.docx *.doc);;所有文件 (*)"
-            )
+            if self._open_dlg is None:
+                self._open_dlg = QFileDialog(self, "打开文档")
+                self._open_dlg.setAcceptMode(QFileDialog.AcceptMode.AcceptOpen)
+                self._open_dlg.setFileMode(QFileDialog.FileMode.ExistingFile)
+                self._open_dlg.setNameFilters([
+                    "所有支持的文档 (*.md *.txt *.docx *.doc)",
+                    "Markdown文件 (*.md)",
+                    "文本文件 (*.txt)",
+                    "Word文档 (*.docx *.doc)",
+                    "所有文件 (*)"
+                ])
+            
+            file_path = self._open_dlg.selectedFiles()[0] if self._open_dlg.exec() else ""
             
             if file_path:
                 # 根据文件类型处理
@@ -471,28 +955,17 @@ class MainWindow(QMainWindow):
                         result = self.word_parser.extract_structured_content(file_path)
                         
                         if result.success:
-                            self.document_widget.text_edit.setPlainText(result.content)
-                            self.status_bar.showMessage(f"Word文档已打开: {file_path_obj.name}")
+                            self.document_widget.set_content(result.content)
                             
                             # 显示解析结果信息
-                            status_info = "📄 Word文档已成功打开！\n\n"
-                            status_info += f"文件: {file_path_obj.name}\n"
-                            status_info += "类型: Word文档\n"
-                            status_info += "状态: 解析完成\n"
-                            
+                            status_info = f"📄 Word文档已打开: {file_path_obj.name}"
                             if result.outline:
-                                status_info += f"大纲项目: {len(result.outline)} 个\n"
-                            
-                            if result.metadata:
-                                if 'method' in result.metadata:
-                                    status_info += f"解析方法: {result.metadata['method']}\n"
+                                status_info += f"，大纲项目 {len(result.outline)} 个"
+                            self._toast(status_info)
                             
+                            # 解析过程中的提示需要用户留意
                             if result.error_message:
-                                status_info += f"注意: {result.error_message}\n"
-                            
-                            status_info += "\n您现在可以编辑和使用所有功能。"
-                            
-                            QMessageBox.information(self, "Word文档", status_info)
+                                QMessageBox.warning(self, "Word文档", f"注意: {result.error_message}")
                         else:
                             # 解析失败，显示详细错误信息
                             error_msg = "❌ 无法解析Word文档\n\n"
@@ -523,64 +996,95 @@ class MainWindow(QMainWindow):
                         QMessageBox.critical(self, "Word文档处理异常", error_msg)
                         return
                 else:
-                    # 普通文本文档
-                    try:
-                        with open(file_path, 'r', encoding='utf-8') as f:
-                            content = f.read()
-                        self.document_widget.text_edit.setPlainText(content)
-                        self.status_bar.showMessage(f"文档已打开: {file_path_obj.name}")
-                        
-                        QMessageBox.information(self, "文档", 
-                                               f"📖 文档已成功打开！\n\n"
-                                               f"文件: {file_path_obj.name}\n"
-                                               f"类型: {file_path_obj.suffix.upper()}文档\n"
-                                               f"编码: UTF-8\n\n"
-                                               f"您现在可以编辑和使用所有功能。")
-                    except Exception as e:
-                        QMessageBox.critical(self, "错误", f"无法打开文档: {str(e)}")
-                        return
-                
-                # 更新大纲导航
-                self.update_outline_content(self.get_current_document_content())
+                    # 普通文本文档在后台线程中分块读取，完成后再更新大纲
+                    self._load_text_document(file_path_obj)
                 
         except Exception as e:
-            QMessageBox.critical(self, "错误", f"打开文档失败: {str(e)}")
+            self._show_error("打开文档失败", e)
+    
+    def _load_text_document(self, file_path: Path):
+        """分块加载文本文档"""
+        # 打开新文档时放弃仍在进行的加载
+        self._cancel_file_load()
+        
+        self.document_widget.begin_load()
+        self._set_load_actions_enabled(False)
+        self.status_bar.showMessage(f"正在打开: {file_path.name}")
+        
+        # 以主窗口为父对象，线程运行期间不会被回收，结束后释放
+        worker = FileLoadWorker(str(file_path), parent=self)
+        worker.finished.connect(worker.deleteLater)
+        worker.chunk.connect(lambda text: self._on_text_chunk_loaded(worker, text))
+        worker.done.connect(lambda: self._on_text_document_loaded(worker, file_path, None))
+        worker.failed.connect(lambda error: self._on_text_document_loaded(worker, file_path, error))
+        self._file_load_worker = worker
+        worker.start()
+    
+    def _on_text_chunk_loaded(self, worker: FileLoadWorker, text: str):
+        """追加读取到的文本块，已取消的加载不再写入编辑器"""
+        if worker is self._file_load_worker:
+            self.document_widget.append_text(text)
+    
+    def _on_text_document_loaded(self, worker: FileLoadWorker, file_path: Path, error: Optional[str]):
+        """文本文档加载完成"""
+        if worker is not self._file_load_worker:
+            return
+        self._file_load_worker = None
+        
+        # 结束加载时发出的内容变化信号会更新大纲导航
+        self.document_widget.end_load()
+        self._set_load_actions_enabled(True)
+        
+        if error is not None:
+            self.status_bar.showMessage("打开文档失败")
+            QMessageBox.critical(self, "错误", f"无法打开文档: {error}")
+            return
+        
+        self._toast(f"📖 文档已打开: {file_path.name}")
     
-    def save_document(self):
+    def _cancel_file_load(self):
+        """取消正在进行的文档加载，已追加的内容由下一次加载清空"""
+        worker = self._file_load_worker
+        if worker is None:
+            return
+        self._file_load_worker = None
+        worker.cancel()
+    
+    def _set_load_actions_enabled(self, enabled: bool):
+        """加载文档期间禁用新建、打开和保存"""
+        for name in self.LOAD_BLOCKED_ACTIONS:
+            action = self._menu_actions.get(name)
+            if action is not None:
+                action.setEnabled(enabled)
+        self.save_btn.setEnabled(enabled)
+    
+    @_requires_content("文档内容为空，无需保存")
+    def save_document(self, content: str):
         """保存文档"""
         try:
-            content = self.get_current_document_content()
-            if not content.strip():
-                QMessageBox.information(self, "提示", "文档内容为空，无需保存")
-                return
+            if self._save_dlg is None:
+                self._save_dlg = QFileDialog(self, "保存文档")
+                self._save_dlg.setAcceptMode(QFileDialog.AcceptMode.AcceptSave)
+                self._save_dlg.setNameFilters([
+                    "Markdown文件 (*.md)",
+                    "文本文件 (*.txt)",
+                    "所有文件 (*)"
+                ])
             
-            file_path, selected_filter = QFileDialog.getSaveFileName(
-                self,
-                "保存文档",
-                "",
-                "Markdown文件 (*.md);;文本文件 (*.txt);;所有文件 (*)"
-            )
+            file_path = self._save_dlg.selectedFiles()[0] if self._save_dlg.exec() else ""
             
             if file_path:
                 try:
                     with open(file_path, 'w', encoding='utf-8') as f:
                         f.write(content)
                     
-                    file_path_obj = Path(file_path)
-                    self.status_bar.showMessage(f"文档已保存: {file_path_obj.name}")
+                    self._toast(f"💾 文档已保存: {file_path}（{len(content)} 字符）")
                     
-                    QMessageBox.information(self, "保存成功", 
-                                           f"💾 文档已成功保存！\n\n"
-                                           f"文件: {file_path_obj.name}\n"
-                                           f"路径: {file_path}\n"
-                                           f"大小: {len(content)} 字符\n"
-                                           f"编码: UTF-8")
-                                           
                 except Exception as e:
-                    QMessageBox.critical(self, "错误", f"保存文档失败: {str(e)}")
+                    self._show_error("保存文档失败", e)
                     
         except Exception as e:
-            QMessageBox.critical(self, "错误", f"保存操作失败: {str(e)}")
+            self._show_error("保存操作失败", e)
     
     # API服务管理方法
     def start_api_service(self):
@@ -591,66 +1095,88 @@ class MainWindow(QMainWindow):
                 return
             
             # 检查虚拟环境和Python解释器
-            venv_python = Path(__file__).parent.parent.parent / "aidocs-env" / "Scripts" / "python.exe"
-            if not venv_python.exists():
-                QMessageBox.warning(self, "警告", f"虚拟环境Python解释器不存在: {venv_python}")
+            if not _VENV_PY.exists():
+                QMessageBox.warning(self, "警告", f"虚拟环境Python解释器不存在: {_VENV_PY}")
                 return
             
             # 检查API脚本是否存在
-            api_script = Path(__file__).parent.parent / "api" / "main.py"
-            if not api_script.exists():
-                QMessageBox.warning(self, "警告", f"API脚本不存在: {api_script}")
+            if not _API_SCRIPT.exists():
+                QMessageBox.warning(self, "警告", f"API脚本不存在: {_API_SCRIPT}")
                 return
             
-            # 设置工作目录为项目根目录
-            work_dir = Path(__file__).parent.parent.parent
-            
-            # 启动API服务（使用虚拟环境中的Python）
-            import subprocess
-            cmd = [
-                str(venv_python), 
-                str(api_script)
-            ]
-            
-            self.api_process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                cwd=str(work_dir)
-            )
-            
-            # 等待服务启动
-            import time
-            time.sleep(3)  # 增加等待时间
+            # 启动API服务（使用虚拟环境中的Python），进程事件由Qt事件循环驱动
+            process = QProcess(self)
+            process.setWorkingDirectory(str(_PROJECT_ROOT))
+            # 服务输出直接追加写入日志文件，无需在界面线程中读取
+            _API_LOG.parent.mkdir(parents=True, exist_ok=True)
+            process.setProcessChannelMode(QProcess.ProcessChannelMode.MergedChannels)
+            process.setStandardOutputFile(str(_API_LOG), QIODevice.OpenModeFlag.Append)
+            process.started.connect(self._on_api_process_started)
+            process.errorOccurred.connect(lambda error: self._on_api_process_error(process, error))
+            process.finished.connect(lambda exit_code, exit_status: self._on_api_process_finished(process))
+            
+            self.api_process = process
+            self._reset_api_polling()
+            self.status_bar.showMessage("API服务启动中...")
+            process.start(str(_VENV_PY), [str(_API_SCRIPT)])
             
-            # 检查服务是否启动成功
-            try:
-                response = requests.get("http://127.0.0.1:8000/health", timeout=10)
-                if response.status_code == 200:
-                    self.status_bar.showMessage("API服务启动成功")
-                    self.api_status_label.setText("API状态: 正常")
-                    self.api_status_label.setStyleSheet("color: green;")
-                    
-                    QMessageBox.information(self, "API服务", 
-                                           "🚀 API服务启动成功！\n\n"
-                                           "服务地址: http://127.0.0.1:8000\n"
-                                           "状态: 运行中\n"
-                                           "健康检查: 通过\n"
-                                           "环境: 虚拟环境\n\n"
-                                           "您现在可以使用所有需要API的功能。")
-                else:
-                    raise Exception(f"健康检查失败: HTTP {response.status_code}")
-                    
-            except Exception as e:
-                self.stop_api_service()
-                QMessageBox.critical(self, "错误", f"API服务启动失败: {str(e)}\n\n"
-                                                   "请检查：\n"
-                                                   "• 端口8000是否被占用\n"
-                                                   "• 虚拟环境是否正常\n"
-                                                   "• 数据库连接是否正常")
-                
         except Exception as e:
-            QMessageBox.critical(self, "错误", f"启动API服务失败: {str(e)}")
+            self._show_error("启动API服务失败", e)
+    
+    def _on_api_process_started(self):
+        """API进程已启动，在后台线程中等待服务就绪，避免阻塞界面"""
+        self._cancel_api_boot()
+        # 以主窗口为父对象，线程运行期间不会被回收
+        self.api_thread = ApiBootWorker(parent=self)
+        self.api_thread.boot_finished.connect(self._on_api_started)
+        self.api_thread.start()
+    
+    def _cancel_api_boot(self):
+        """取消上一次的启动检查，过期的结果不再上报"""
+        worker = self.api_thread
+        if worker is None:
+            return
+        self.api_thread = None
+        worker.boot_finished.disconnect(self._on_api_started)
+        worker.cancel()
+        # 仍在运行的线程结束后再释放
+        worker.finished.connect(worker.deleteLater)
+        if not worker.isRunning():
+            worker.deleteLater()
+    
+    def _on_api_process_error(self, process: QProcess, error: QProcess.ProcessError):
+        """API进程错误"""
+        if error == QProcess.ProcessError.FailedToStart and process is self.api_process:
+            self.api_process = None
+            process.deleteLater()
+            QMessageBox.critical(self, "错误", f"启动API服务失败: {process.errorString()}")
+    
+    def _on_api_process_finished(self, process: QProcess):
+        """API进程退出"""
+        if process is self.api_process:
+            # 服务意外退出
+            self.api_process = None
+            self._reset_api_polling()
+            self.status_bar.showMessage("API服务已退出")
+        process.deleteLater()
+    
+    def _on_api_started(self, success: bool, message: str):
+        """API服务启动检查完成"""
+        if self.api_process is None:
+            # 服务已被停止，忽略过期的检查结果
+            return
+        
+        if success:
+            self.api_status_label.setText("API状态: 正常")
+            self.api_status_label.setStyleSheet("color: green;")
+            self._toast("🚀 API服务启动成功: http://127.0.0.1:8000")
+        else:
+            self.stop_api_service()
+            QMessageBox.critical(self, "错误", f"API服务启动失败: {message}\n\n"
+                                               "请检查：\n"
+                                               "• 端口8000是否被占用\n"
+                                               "• 虚拟环境是否正常\n"
+                                               "• 数据库连接是否正常")
     
     def stop_api_service(self):
         """停止API服务"""
@@ -659,49 +1185,40 @@ class MainWindow(QMainWindow):
                 QMessageBox.information(self, "提示", "API服务未在运行")
                 return
             
-            # 停止进程
-            self.api_process.terminate()
-            
-            # 等待进程结束
-            import time
-            time.sleep(1)
-            
-            if self.api_process.poll() is None:
-                # 强制杀死进程
-                self.api_process.kill()
-            
+            # 停止进程，2秒后仍未退出则强制杀死
+            self._cancel_api_boot()
+            process = self.api_process
             self.api_process = None
+            process.terminate()
+            kill_timer = QTimer(process)  # 随进程对象一起销毁
+            kill_timer.setSingleShot(True)
+            kill_timer.timeout.connect(process.kill)
+            kill_timer.start(2000)
+
+            self._reset_api_polling()
             
             # 更新状态
-            self.status_bar.showMessage("API服务已停止")
             self.api_status_label.setText("API状态: 未连接")
             self.api_status_label.setStyleSheet("color: red;")
+            self._toast("⏹️ API服务已停止")
             
-            QMessageBox.information(self, "API服务", 
-                                   "⏹️ API服务已停止！\n\n"
-                                   "状态: 已停止\n"
-                                   "进程: 已终止\n\n"
-                                   "如需使用API功能，请重新启动服务。")
-                                   
         except Exception as e:
-            QMessageBox.critical(self, "错误", f"停止API服务失败: {str(e)}")
+            self._show_error("停止API服务失败", e)
     
     def restart_api_service(self):
         """重启API服务"""
         try:
-            QMessageBox.information(self, "重启服务", "正在重启API服务...")
+            self._toast("正在重启API服务...")
             
-            # 先停止服务
+            # 先停止服务，进程退出后再启动
             if self.api_process is not None:
+                self.api_process.finished.connect(lambda *args: self.start_api_service())
                 self.stop_api_service()
-                import time
-                time.sleep(1)
-            
-            # 再启动服务
-            self.start_api_service()
+            else:
+                self.start_api_service()
             
         except Exception as e:
-            QMessageBox.critical(self, "错误", f"重启API服务失败: {str(e)}")
+            self._show_error("重启API服务失败", e)
     
     def check_api_service_status(self):
         """检查API服务状态"""
@@ -709,34 +1226,41 @@ class MainWindow(QMainWindow):
             # 检查进程状态
             process_status = "未运行"
             if self.api_process is not None:
-                if self.api_process.poll() is None:
+                if self.api_process.state() != QProcess.ProcessState.NotRunning:
                     process_status = "运行中"
                 else:
                     process_status = "已停止"
                     self.api_process = None
             
-            # 检查网络连接
-            network_status = "无法连接"
-            api_info = ""
+            # 异步检查网络连接，结果返回后再显示
+            self._toast("正在检查API服务状态...")
+            self.api_client.request_health(
+                lambda status_code, data, error: self._show_api_service_status(process_status, status_code, data, error)
+            )
             
-            try:
-                response = requests.get("http://127.0.0.1:8000/health", timeout=3)
-                if response.status_code == 200:
-                    network_status = "连接正常"
-                    health_data = response.json()
-                    api_info = f"版本: {health_data.get('version', 'Unknown')}\n"
-                    api_info += f"启动时间: {health_data.get('timestamp', 'Unknown')}"
-                else:
-                    network_status = f"HTTP {response.status_code}"
-            except Exception:
+        except Exception as e:
+            self._show_error("检查API服务状态失败", e)
+    
+    def _show_api_service_status(self, process_status: str, status_code: Optional[int], data: Any, error: str):
+        """显示API服务状态检查结果"""
+        try:
+            api_info = ""
+            if status_code is None or error:
                 network_status = "连接失败"
+            elif status_code == 200:
+                network_status = "连接正常"
+                if isinstance(data, dict):
+                    api_info = f"版本: {data.get('version', 'Unknown')}\n"
+                    api_info += f"启动时间: {data.get('timestamp', 'Unknown')}"
+            else:
+                network_status = f"HTTP {status_code}"
             
             # 显示状态信息
             status_text = f"""🔍 API服务状态检查：
 
 📊 进程状态: {process_status}
 🌐 网络状态: {network_status}
-📡 服务地址: http://127.0.0.1:8000
+📡 服务地址: {self.api_client.base_url}
 
 {api_info if api_info else '无额外信息'}
 
@@ -749,7 +1273,7 @@ class MainWindow(QMainWindow):
             QMessageBox.information(self, "API服务状态", status_text)
             
         except Exception as e:
-            QMessageBox.critical(self, "错误", f"检查API服务状态失败: {str(e)}")
+            self._show_error("检查API服务状态失败", e)
     
     def configure_api_service(self):
         """配置API服务"""
@@ -772,42 +1296,42 @@ class MainWindow(QMainWindow):
                     return
                 
                 # 更新配置
-                self.api_client.base_url = new_url
+                self.api_client.set_base_url(new_url)
+                self._reset_api_polling()
                 
-                # 测试连接
-                try:
-                    response = requests.get(f"{new_url}/health", timeout=5)
-                    if response.status_code == 200:
-                        QMessageBox.information(self, "配置成功", 
-                                               f"✅ API配置更新成功！\n\n"
-                                               f"新地址: {new_url}\n"
-                                               f"连接测试: 通过\n"
-                                               f"状态: 可用")
-                        
-                        # 更新状态显示
-                        self.api_status_label.setText("API状态: 正常")
-                        self.api_status_label.setStyleSheet("color: green;")
-                    else:
-                        QMessageBox.warning(self, "警告", 
-                                           f"API地址已更新，但连接测试失败\n"
-                                           f"HTTP状态码: {response.status_code}")
-                except Exception as e:
-                    QMessageBox.warning(self, "警告", 
-                                       f"API地址已更新，但无法连接到服务\n"
-                                       f"错误: {str(e)}")
+                # 异步测试连接
+                self.api_client.request_health(
+                    lambda status_code, data, error: self._on_api_config_tested(status_code, error)
+                )
                 
         except Exception as e:
-            QMessageBox.critical(self, "错误", f"配置API服务失败: {str(e)}")
+            self._show_error("配置API服务失败", e)
+    
+    def _on_api_config_tested(self, status_code: Optional[int], error: str):
+        """API配置连接测试完成"""
+        if status_code == 200:
+            self._toast(f"✅ API配置更新成功: {self.api_client.base_url}")
+            
+            # 更新状态显示
+            self.api_status_label.setText("API状态: 正常")
+            self.api_status_label.setStyleSheet("color: green;")
+        elif status_code is not None:
+            QMessageBox.warning(self, "警告", 
+                               f"API地址已更新，但连接测试失败\n"
+                               f"HTTP状态码: {status_code}")
+        else:
+            QMessageBox.warning(self, "警告", 
+                               f"API地址已更新，但无法连接到服务\n"
+                               f"错误: {error}")
     
     def new_template(self):
         """新建模板"""
         try:
-            from src.gui.template_manager_gui import TemplateManagerGUI
-            self.template_manager_window = TemplateManagerGUI()
-            self.template_manager_window.new_template()
-            self.template_manager_window.show()
+            window = self._get_template_manager_window()
+            window.new_template()
+            self._show_template_manager_window()
         except Exception as e:
-            QMessageBox.critical(self, "错误", f"无法创建新模板: {str(e)}")
+            self._show_error("无法创建新模板", e)
     
     def open_word_document(self):
         """打开Word文档"""
@@ -821,131 +1345,82 @@ class MainWindow(QMainWindow):
                                    "在实际使用中，可以选择Word文件进行打开和编辑。")
             
         except Exception as e:
-            QMessageBox.critical(self, "错误", f"打开Word文档失败: {str(e)}")
+            self._show_error("打开Word文档失败", e)
     
-    def save_as_word(self):
+    @_requires_content("请先输入一些内容再保存为Word")
+    def save_as_word(self, content: str):
         """保存为Word"""
         try:
-            content = self.get_current_document_content()
-            if not content.strip():
-                QMessageBox.information(self, "提示", "请先输入一些内容再保存为Word")
-                return
-            
-            QMessageBox.information(self, "保存为Word", 
-                                   "💾 保存为Word功能！\n\n"
-                                   "✅ Markdown → Word转换\n"
-                                   "✅ 保留格式和结构\n"
-                                   "✅ 支持复杂文档\n"
-                                   "✅ 兼容Office套件\n\n"
-                                   "在实际使用中，会将当前文档保存为Word格式。")
+            self._toast("💾 保存为Word：当前文档将转换为Word格式")
             
         except Exception as e:
-            QMessageBox.critical(self, "错误", f"保存为Word失败: {str(e)}")
+            self._show_error("保存为Word失败", e)
     
-    def generate_outline(self):
+    @_requires_content("请先输入一些内容再生成大纲")
+    def generate_outline(self, content: str):
         """生成大纲"""
         try:
-            content = self.get_current_document_content()
-            if not content.strip():
-                QMessageBox.information(self, "提示", "请先输入一些内容再生成大纲")
-                return
-            
             # 检查AI服务可用性
-            if not self.ai_service.is_available():
+            if not self._ai_available():
                 QMessageBox.warning(self, "警告", "AI服务不可用，请检查配置")
                 return
             
-            self.status_bar.showMessage("正在生成大纲...")
-            
             # 这里应该调用AI服务生成大纲
-            # 为了演示，我们显示一个信息对话框
-            QMessageBox.information(self, "AI大纲生成", 
-                                   "🤖 AI大纲生成功能已触发！\n\n"
-                                   "✅ 文档内容已分析\n"
-                                   "✅ AI服务已连接\n"
-                                   "✅ 大纲生成完成\n\n"
-                                   "在实际使用中，这里会根据文档内容自动生成结构化大纲。")
-            
-            self.status_bar.showMessage("大纲生成完成")
+            # 为了演示，在状态栏中提示结果
+            self._toast("🤖 AI大纲生成完成")
             
         except Exception as e:
-            QMessageBox.critical(self, "错误", f"生成大纲失败: {str(e)}")
+            self._show_error("生成大纲失败", e)
     
-    def get_content_suggestions(self):
+    @_requires_content("请先输入一些内容再获取建议")
+    def get_content_suggestions(self, content: str):
         """获取内容建议"""
         try:
-            content = self.get_current_document_content()
-            if not content.strip():
-                QMessageBox.information(self, "提示", "请先输入一些内容再获取建议")
-                return
-            
-            if not self.ai_service.is_available():
+            if not self._ai_available():
                 QMessageBox.warning(self, "警告", "AI服务不可用，请检查配置")
                 return
             
-            self.status_bar.showMessage("正在分析内容...")
-            
-            QMessageBox.information(self, "AI内容建议", 
-                                   "💡 AI内容建议功能已触发！\n\n"
-                                   "建议内容：\n"
-                                   "1. 添加更多详细说明\n"
-                                   "2. 增加示例和案例\n"
-                                   "3. 完善章节结构\n"
-                                   "4. 添加总结部分\n\n"
-                                   "在实际使用中，AI会根据文档内容提供个性化建议。")
-            
-            self.status_bar.showMessage("内容建议已生成")
+            self._toast("💡 AI内容建议已生成")
             
         except Exception as e:
-            QMessageBox.critical(self, "错误", f"获取内容建议失败: {str(e)}")
+            self._show_error("获取内容建议失败", e)
     
-    def improve_writing(self):
+    @_requires_content("请先输入一些内容再进行写作改进")
+    def improve_writing(self, content: str):
         """改进写作"""
         try:
-            content = self.get_current_document_content()
-            if not content.strip():
-                QMessageBox.information(self, "提示", "请先输入一些内容再进行写作改进")
-                return
-            
-            if not self.ai_service.is_available():
+            if not self._ai_available():
                 QMessageBox.warning(self, "警告", "AI服务不可用，请检查配置")
                 return
             
-            self.status_bar.showMessage("正在分析写作...")
-            
-            QMessageBox.information(self, "AI写作改进", 
-                                   "✍️ AI写作改进功能已触发！\n\n"
-                                   "改进建议：\n"
-                                   "• 语法检查: 已检查，无错误\n"
-                                   "• 表达优化: 建议使用更准确的词汇\n"
-                                   "• 逻辑结构: 建议调整段落顺序\n"
-                                   "• 风格统一: 保持一致的写作风格\n\n"
-                                   "在实际使用中，AI会提供具体的修改建议。")
-            
-            self.status_bar.showMessage("写作改进建议已生成")
+            self._toast("✍️ AI写作改进建议已生成")
             
         except Exception as e:
-            QMessageBox.critical(self, "错误", f"写作改进失败: {str(e)}")
+            self._show_error("写作改进失败", e)
     
-    def analyze_document(self):
+    @_requires_content("请先输入一些内容再进行分析")
+    def analyze_document(self, content: str):
         """文档分析"""
         try:
-            content = self.get_current_document_content()
-            if not content.strip():
-                QMessageBox.information(self, "提示", "请先输入一些内容再进行分析")
-                return
-            
-            # 进行基本的文档分析
-            lines = content.split('\n')
-            words = len(content.split())
+            # 进行基本的文档分析（一次遍历完成所有统计）
+            line_count = 0
+            words = 0
+            headings = 0
+            paragraphs = 0
+            for line in content.split('\n'):
+                line_count += 1
+                stripped = line.strip()
+                if stripped.startswith('#'):
+                    headings += 1
+                elif stripped:
+                    paragraphs += 1
+                words += len(line.split())
             chars = len(content)
-            headings = len([line for line in lines if line.strip().startswith('#')])
-            paragraphs = len([line for line in lines if line.strip() and not line.strip().startswith('#')])
             
             analysis_text = f"""📊 文档分析结果：
 
 📝 基本统计：
-• 总行数: {len(lines)}
+• 总行数: {line_count}
 • 总字数: {words}
 • 总字符数: {chars}
 • 标题数量: {headings}
@@ -965,29 +1440,22 @@ class MainWindow(QMainWindow):
             QMessageBox.information(self, "文档分析", analysis_text)
             
         except Exception as e:
-            QMessageBox.critical(self, "错误", f"文档分析失败: {str(e)}")
+            self._show_error("文档分析失败", e)
     
     def word_to_markdown(self):
         """Word转Markdown"""
         try:
-            QMessageBox.information(self, "Word转Markdown", 
-                                   "🔄 Word转Markdown功能！\n\n"
-                                   "转换特性：\n"
-                                   "• 保留标题层次\n"
-                                   "• 转换列表和表格\n"
-                                   "• 保留链接和图片\n"
-                                   "• 清理格式代码\n\n"
-                                   "请选择要转换的Word文档。")
+            self._toast("🔄 Word转Markdown：请选择要转换的Word文档")
             
         except Exception as e:
-            QMessageBox.critical(self, "错误", f"Word转Markdown失败: {str(e)}")
+            self._show_error("Word转Markdown失败", e)
     
-    def markdown_to_word(self):
+    @_requires_content("请先输入Markdown内容")
+    def markdown_to_word(self, content: str):
         """Markdown转Word（使用优化转换器）"""
         try:
-            content = self.get_current_document_content()
-            if not content.strip():
-                QMessageBox.information(self, "提示", "请先输入Markdown内容")
+            if self._md_word_worker is not None and self._md_word_worker.isRunning():
+                QMessageBox.information(self, "提示", "正在转换其他文档，请稍候")
                 return
             
             # 使用OptimizedFormatConverter进行转换（与md2docx_optimized.py保持一致）
@@ -1005,25 +1473,13 @@ class MainWindow(QMainWindow):
                 if not file_path:
                     return
                 
-                # 创建优化转换器并转换
-                converter = OptimizedFormatConverter()
-                converter.convert_markdown_to_word(content)
-                converter.save_document(file_path)
-                
-                # 检查文件大小
-                import os
-                file_size = os.path.getsize(file_path)
-                
-                QMessageBox.information(self, "转换成功", 
-                                       f"🎉 Markdown转Word成功！\n\n"
-                                       f"• 文件位置: {file_path}\n"
-                                       f"• 文件大小: {file_size:,} 字节 ({file_size/1024:.1f}KB)\n"
-                                       f"• 转换引擎: OptimizedFormatConverter\n"
-                                       f"• 状态: 转换完成\n\n"
-                                       f"✅ 优化特性:\n"
-                                       f"  ✓ 代码块换行完美保留\n"
-                                       f"  ✓ 字体显示为微软雅黑\n"
-                                       f"  ✓ 表格格式美观规整")
+                # 在后台线程中创建优化转换器并转换
+                worker = MarkdownToWordWorker(OptimizedFormatConverter, content, file_path)
+                worker.converted.connect(self._on_markdown_to_word_converted)
+                worker.failed.connect(self._on_markdown_to_word_failed)
+                self._md_word_worker = worker
+                self.status_bar.showMessage("正在转换为Word文档...")
+                worker.start()
                 
             except ImportError as e:
                 QMessageBox.critical(self, "错误", 
@@ -1032,47 +1488,51 @@ class MainWindow(QMainWindow):
                 return
                     
             except Exception as e:
-                QMessageBox.critical(self, "错误", f"转换过程失败: {str(e)}")
+                self._show_error("转换过程失败", e)
                 
         except Exception as e:
-            QMessageBox.critical(self, "错误", f"Markdown转Word失败: {str(e)}")
+            self._show_error("Markdown转Word失败", e)
+    
+    def _on_markdown_to_word_converted(self, file_path: str, file_size: int):
+        """Markdown转Word完成"""
+        self.status_bar.clearMessage()
+        QMessageBox.information(self, "转换成功", 
+                               f"🎉 Markdown转Word成功！\n\n"
+                               f"• 文件位置: {file_path}\n"
+                               f"• 文件大小: {file_size:,} 字节 ({file_size/1024:.1f}KB)\n"
+                               f"• 转换引擎: OptimizedFormatConverter\n"
+                               f"• 状态: 转换完成\n\n"
+                               f"✅ 优化特性:\n"
+                               f"  ✓ 代码块换行完美保留\n"
+                               f"  ✓ 字体显示为微软雅黑\n"
+                               f"  ✓ 表格格式美观规整")
+    
+    def _on_markdown_to_word_failed(self, error: str):
+        """Markdown转Word失败"""
+        self.status_bar.clearMessage()
+        QMessageBox.critical(self, "错误", f"转换过程失败: {error}")
     
     def test_word_features(self):
         """测试Word功能"""
         try:
             # 测试Word解析器可用性
-            if not hasattr(self.word_parser, 'is_word_support_available'):
-                QMessageBox.information(self, "Word功能测试", 
-                                       "🔧 Word功能测试结果：\n\n"
-                                       "✅ Word解析器已加载\n"
-                                       "✅ 依赖库已安装\n"
-                                       "✅ 功能模块正常\n"
-                                       "✅ 转换功能可用\n\n"
-                                       "Word功能已就绪，可以正常使用！")
+            if self._word_support_available():
+                self._toast("✅ Word功能测试通过，所有Word相关功能都已就绪")
             else:
-                available = self.word_parser.is_word_support_available()
-                if available:
-                    QMessageBox.information(self, "Word功能测试", 
-                                           "✅ Word功能测试通过！\n\n"
-                                           "所有Word相关功能都已就绪：\n"
-                                           "• 文档读取\n"
-                                           "• 格式转换\n"
-                                           "• 结构解析\n"
-                                           "• 保存导出")
-                else:
-                    QMessageBox.warning(self, "Word功能测试", 
-                                       "⚠️ Word功能不可用\n\n"
-                                       "请检查依赖库安装：\n"
-                                       "• python-docx\n"
-                                       "• docx2txt")
+                QMessageBox.warning(self, "Word功能测试", 
+                                   "⚠️ Word功能不可用\n\n"
+                                   "请检查依赖库安装：\n"
+                                   "• python-docx\n"
+                                   "• docx2txt")
             
         except Exception as e:
-            QMessageBox.critical(self, "错误", f"测试Word功能失败: {str(e)}")
+            self._show_error("测试Word功能失败", e)
     
     def launch_full_editor(self):
         """启动完整编辑器"""
         try:
             if not self.document_editor:
+                from src.gui.document_editor import DocumentEditor
                 self.document_editor = DocumentEditor()
                 self.document_editor.setWindowTitle("AI文档管理系统 - 完整编辑器")
                 self.document_editor.resize(1000, 700)
@@ -1081,78 +1541,71 @@ class MainWindow(QMainWindow):
             self.document_editor.raise_()
             self.document_editor.activateWindow()
             
-            QMessageBox.information(self, "完整编辑器", 
-                                   "🚀 完整编辑器已启动！\n\n"
-                                   "完整编辑器功能：\n"
-                                   "• 多标签页管理\n"
-                                   "• 高级编辑功能\n"
-                                   "• 文件操作\n"
-                                   "• AI功能集成\n\n"
-                                   "您可以在新窗口中体验完整功能。")
+            self._toast("🚀 完整编辑器已启动")
             
         except Exception as e:
-            QMessageBox.critical(self, "错误", f"启动完整编辑器失败: {str(e)}")
+            self._show_error("启动完整编辑器失败", e)
     
     def check_system_status(self):
         """检查系统状态"""
         try:
-            status_info = "🔍 系统状态检查：\n\n"
+            parts = ["🔍 系统状态检查：", ""]
             
             # 检查AI服务
             try:
-                if self.ai_service.is_available():
-                    status_info += "✅ AI服务: 已连接\n"
-                else:
-                    status_info += "❌ AI服务: 未连接\n"
+                parts.append("✅ AI服务: 已连接" if self._ai_available() else "❌ AI服务: 未连接")
             except Exception:
-                status_info += "⚠️ AI服务: 配置错误\n"
+                parts.append("⚠️ AI服务: 配置错误")
             
             # 检查Word支持
             try:
-                if hasattr(self.word_parser, 'is_word_support_available'):
-                    if self.word_parser.is_word_support_available():
-                        status_info += "✅ Word支持: 已启用\n"
-                    else:
-                        status_info += "❌ Word支持: 依赖缺失\n"
-                else:
-                    status_info += "✅ Word支持: 已启用\n"
+                parts.append("✅ Word支持: 已启用" if self._word_support_available() else "❌ Word支持: 依赖缺失")
             except Exception:
-                status_info += "⚠️ Word支持: 加载错误\n"
+                parts.append("⚠️ Word支持: 加载错误")
             
-            # 检查大纲导航
-            status_info += "✅ 大纲导航: 已就绪\n"
-            
-            # 检查文档编辑
-            status_info += "✅ 文档编辑: 已就绪\n"
-            
-            # 检查模板系统
-            status_info += "✅ 模板系统: 已就绪\n"
-            
-            status_info += "\n🎉 系统功能全面正常！"
+            # 大纲导航、文档编辑、模板系统
+            parts.extend([
+                "✅ 大纲导航: 已就绪",
+                "✅ 文档编辑: 已就绪",
+                "✅ 模板系统: 已就绪",
+                "",
+                "🎉 系统功能全面正常！"
+            ])
             
-            QMessageBox.information(self, "系统状态", status_info)
+            QMessageBox.information(self, "系统状态", "\n".join(parts))
             
         except Exception as e:
-            QMessageBox.critical(self, "错误", f"系统状态检查失败: {str(e)}")
+            self._show_error("系统状态检查失败", e)
+    
+    def _get_template_manager_window(self):
+        """获取模板管理器窗口（首次使用时创建，之后复用）"""
+        if self.template_manager_window is None:
+            from src.gui.template_manager_gui import TemplateManagerGUI
+            self.template_manager_window = TemplateManagerGUI()
+        return self.template_manager_window
+    
+    def _show_template_manager_window(self):
+        """显示模板管理器窗口并置于前台"""
+        window = self._get_template_manager_window()
+        window.show()
+        window.raise_()
+        window.activateWindow()
     
     def open_template_manager(self):
         """打开模板管理器"""
         try:
-            from src.gui.template_manager_gui import TemplateManagerGUI
-            self.template_manager_window = TemplateManagerGUI()
-            self.template_manager_window.show()
+            self._show_template_manager_window()
         except Exception as e:
-            QMessageBox.critical(self, "错误", f"无法打开模板管理器: {str(e)}")
+            self._show_error("无法打开模板管理器", e)
     
     def import_template(self):
         """导入模板"""
         try:
-            from src.gui.template_manager_gui import TemplateManagerGUI
-            self.template_manager_window = TemplateManagerGUI()
-            self.template_manager_window.import_template()
-            self.template_manager_window.show()
+            self._get_template_manager_window().import_template()
+            self._tm_stats_cache = None
+            self._show_template_manager_window()
         except Exception as e:
-            QMessageBox.critical(self, "错误", f"无法导入模板: {str(e)}")
+            self._show_error("无法导入模板", e)
     
     def export_template(self):
         """导出模板"""
@@ -1160,68 +1613,106 @@ class MainWindow(QMainWindow):
         self.open_template_manager()
     
     def template_statistics(self):
-        """模板统计"""
+        """模板统计（模板未变化时复用上次结果，否则在后台线程中统计）"""
         try:
-            from src.core.template_manager import TemplateManager
-            tm = TemplateManager(self.settings.templates_dir)
-            stats = tm.get_template_statistics()
+            mtime = self._template_metadata_mtime_now()
+            if self._tm_stats_cache is not None and self._tm_stats_cache[0] == mtime:
+                self._show_template_statistics(self._tm_stats_cache[1])
+                return
+            
+            if self._tm_stats_worker is not None and self._tm_stats_worker.isRunning():
+                return
+            
+            # 模板管理器在界面线程中创建或重新加载，后台线程只负责统计
+            manager = self._get_template_manager()
+            worker = TemplateStatsWorker(manager.get_template_statistics, mtime)
+            worker.stats_ready.connect(self._on_template_stats_ready)
+            worker.failed.connect(lambda error: QMessageBox.critical(self, "错误", f"无法获取模板统计: {error}"))
+            self._tm_stats_worker = worker
+            worker.start()
+        except Exception as e:
+            self._show_error("无法获取模板统计", e)
+    
+    def _on_template_stats_ready(self, metadata_mtime: Optional[float], stats: dict):
+        """模板统计完成"""
+        self._tm_stats_cache = (metadata_mtime, stats)
+        self._show_template_statistics(stats)
+    
+    def _show_template_statistics(self, stats: dict):
+        """显示模板统计信息"""
+        try:
+            parts = [
+                "模板统计信息：",
+                "",
+                f"总模板数量: {stats['total_templates']}",
+                f"分类数量: {len(stats['categories'])}",
+                f"分类列表: {', '.join(stats['categories'])}",
+                "",
+                "分类统计:"
+            ]
+            parts.extend(f"  {category}: {count}个" for category, count in stats['category_counts'].items())
             
-            stats_text = f"""模板统计信息：
-
-总模板数量: {stats['total_templates']}
-分类数量: {len(stats['categories'])}
-分类列表: {', '.join(stats['categories'])}
-
-分类统计:
-"""
-            for category, count in stats['category_counts'].items():
-                stats_text += f"  {category}: {count}个\n"
-                
             if stats['most_used']:
-                stats_text += "\n最常用模板:\n"
-                for template in stats['most_used']:
-                    stats_text += f"  {template['name']}: {template['usage_count']}次\n"
+                parts.append("")
+                parts.append("最常用模板:")
+                parts.extend(f"  {template['name']}: {template['usage_count']}次" for template in stats['most_used'])
             
-            QMessageBox.information(self, "模板统计", stats_text)
+            QMessageBox.information(self, "模板统计", "\n".join(parts) + "\n")
         except Exception as e:
-            QMessageBox.critical(self, "错误", f"无法获取模板统计: {str(e)}")
+            self._show_error("无法获取模板统计", e)
+    
+    def _template_metadata_mtime_now(self) -> Optional[float]:
+        """模板元数据文件的修改时间，文件不存在时为None"""
+        metadata_file = Path(self.settings.templates_dir) / "metadata.json"
+        return metadata_file.stat().st_mtime if metadata_file.exists() else None
+    
+    def _get_template_manager(self):
+        """获取模板管理器（复用实例，模板元数据文件变化时重新加载）"""
+        if self._template_manager is None:
+            from src.core.template_manager import TemplateManager
+            self._template_manager = TemplateManager(self.settings.templates_dir)
+        else:
+            self._template_manager.reload_if_changed()
+        return self._template_manager
     
     def refresh_data(self):
         """刷新数据"""
         self.load_initial_data()
-        QMessageBox.information(self, "提示", "数据已刷新")
+        self._toast("数据已刷新")
     
     def toggle_outline_navigator(self):
         """切换大纲导航的显示状态"""
         try:
             # 大纲导航现在直接显示，只需要更新内容
             self.update_outline_content(self.get_current_document_content())
-            QMessageBox.information(self, "大纲导航", "大纲内容已更新！")
+            self._toast("大纲内容已更新")
         except Exception as e:
             QMessageBox.warning(self, "警告", f"更新大纲导航失败: {str(e)}")
     
     def jump_to_line(self, line_number: int):
         """跳转到指定行"""
         try:
-            # 获取当前文档编辑器
-            current_widget = self.tab_widget.currentWidget()
-            if isinstance(current_widget, DocumentWidget):
-                text_edit = current_widget.text_edit
-                # 获取文本光标
-                cursor = text_edit.textCursor()
-                # 移动到指定行
-                cursor.movePosition(cursor.MoveOperation.Start)
-                for _ in range(line_number - 1):
-                    cursor.movePosition(cursor.MoveOperation.Down)
-                # 设置光标位置
-                text_edit.setTextCursor(cursor)
-                text_edit.ensureCursorVisible()
-                text_edit.setFocus()
+            # 纯文本编辑器中每一行对应一个文本块
+            self._goto_block(line_number - 1)
         except Exception as e:
             QMessageBox.warning(self, "警告", f"无法跳转到第{line_number}行: {str(e)}")
     
+    def _goto_block(self, block_number: int):
+        """将光标直接定位到指定编号的文本块"""
+        current_widget = self._current_doc_widget
+        if current_widget is None:
+            return
+        text_edit = current_widget.text_edit
+        document = text_edit.document()
+        block = document.findBlockByNumber(max(0, block_number))
+        if not block.isValid():
+            block = document.lastBlock()
+        text_edit.setTextCursor(QTextCursor(block))
+        text_edit.ensureCursorVisible()
+        text_edit.setFocus()
+    
     def update_outline_content(self, content: str):
-        """更新大纲内容"""
+        """更新大纲内容（大纲导航自身的刷新定时器会合并连续更新）"""
         try:
             if hasattr(self, 'outline_navigator'):
                 self.outline_navigator.update_content(content)
@@ -1230,13 +1721,8 @@ class MainWindow(QMainWindow):
     
     def get_current_document_content(self) -> str:
         """获取当前文档内容"""
-        try:
-            current_widget = self.tab_widget.currentWidget()
-            if isinstance(current_widget, DocumentWidget):
-                return current_widget.text_edit.toPlainText()
-            return ""
-        except Exception:
-            return ""
+        current_widget = self._current_doc_widget
+        return current_widget.content() if current_widget is not None else ""
     
     def toggle_edit_mode(self):
         """切换编辑模式"""
@@ -1252,122 +1738,8 @@ class MainWindow(QMainWindow):
     
     def setup_demo_content(self):
         """设置演示内容"""
-        demo_content = """# AI文档管理系统 - 完整功能演示
-
-## 🎯 系统简介
-AI文档管理系统是一个基于PyQt6的智能文档管理平台，集成了Word处理、AI助手、大纲导航等核心功能。
-
-## 🚀 主要功能
-
-### 1. 文档编辑器
-- **多标签页管理**: 支持同时编辑多个文档
-- **语法高亮**: Markdown语法高亮显示
-- **自动保存**: 防止数据丢失
-- **查找替换**: 快速定位和修改内容
-
-### 2. Word文档支持
-- **读取Word文档**: 支持.docx和.doc格式
-- **转换功能**: Word ↔ Markdown互转
-- **结构保持**: 保留文档层次结构
-- **格式处理**: 处理复杂格式和样式
-
-### 3. 大纲导航
-- **实时更新**: 文档结构自动解析
-- **快速跳转**: 点击大纲项目直接跳转
-- **多级支持**: 支持多级标题结构
-- **智能识别**: 自动识别标题和章节
-
-### 4. AI智能助手
-- **大纲生成**: 根据内容自动生成大纲
-- **内容建议**: 提供写作建议和改进
-- **文档分析**: 智能分析文档结构
-- **写作辅助**: 提供创作灵感和优化建议
-
-### 5. 模板管理
-- **模板库**: 丰富的文档模板
-- **分类管理**: 按类型组织模板
-- **自定义模板**: 创建个人模板
-- **导入导出**: 模板的批量管理
-
-## 📊 技术架构
-
-### 前端技术
-- **GUI框架**: PyQt6 - 现代化桌面应用框架
-- **界面设计**: 响应式布局，支持多分辨率
-- **交互体验**: 直观的用户界面和操作流程
-
-### 后端技术
-- **文档处理**: python-docx - 专业Word文档处理
-- **AI集成**: OpenAI兼容API - 智能功能支持
-- **搜索引擎**: Whoosh - 全文搜索功能
-- **数据存储**: SQLite - 轻量级数据库
-
-### 核心特性
-- **模块化设计**: 松耦合的架构设计
-- **异常处理**: 完善的错误处理机制
-- **性能优化**: 高效的文档处理算法
-- **扩展性**: 支持功能模块的灵活扩展
-
-## 🎮 使用指南
-
-### 基本操作
-1. **新建文档**: 文件 → 新建文档
-2. **打开文档**: 文件 → 打开文档
-3. **保存文档**: Ctrl+S 或点击保存按钮
-4. **编辑内容**: 在右侧编辑器中输入内容
-
-### 高级功能
-1. **Word处理**: 文件 → 打开Word文档
-2. **大纲导航**: 查看 → 显示大纲导航
-3. **AI助手**: 使用AI菜单中的各项功能
-4. **模板管理**: 模板 → 模板管理器
-
-### 快捷键
-- **Ctrl+N**: 新建文档
-- **Ctrl+O**: 打开文档
-- **Ctrl+S**: 保存文档
-- **Ctrl+F**: 查找内容
-- **F5**: 刷新界面
-
-## 📈 开发进度
-
-### 已完成功能 ✅
-- [x] 核心文档编辑器
-- [x] Word文档处理
-- [x] 大纲导航系统
-- [x] AI服务集成
-- [x] 模板管理系统
-- [x] 用户界面优化
-
-### 开发中功能 🔄
-- [ ] 全文搜索引擎
-- [ ] 文档版本控制
-- [ ] 协作编辑功能
-- [ ] 云端同步
-
-### 规划中功能 📋
-- [ ] 插件系统
-- [ ] 主题定制
-- [ ] 多语言支持
-- [ ] 移动端适配
-
-## 💡 使用建议
-
-1. **初次使用**: 建议从简单的Markdown文档开始
-2. **Word处理**: 大文档建议先备份再处理
-3. **AI功能**: 需要配置API密钥才能使用
-4. **模板使用**: 选择合适的模板可以提高效率
-
----
-
-*这是一个完整的演示文档，展示了系统的所有核心功能。您可以在左侧大纲导航中查看文档结构，尝试编辑内容，体验各项功能。*
-"""
-        
-        # 设置演示内容到文档编辑器
-        self.document_widget.text_edit.setPlainText(demo_content)
-        
-        # 更新大纲导航
-        self.update_outline_content(demo_content)
+        # 设置演示内容到文档编辑器（同时更新大纲导航）
+        self.document_widget.set_content(_DEMO_CONTENT)
         
         # 更新状态栏
         self.status_bar.showMessage("演示内容已加载 - 所有功能已就绪")
@@ -1375,87 +1747,15 @@ AI文档管理系统是一个基于PyQt6的智能文档管理平台，集成了W
     def show_word_enhanced_features(self):
         """显示Word增强功能信息"""
         try:
-            # 获取功能支持状态
-            features = self.word_parser.get_supported_features()
-            has_enhanced = self.word_parser.has_enhanced_features()
-            
-            # 构建信息内容
-            info_lines = [
-                "🚀 AI文档管理系统 - Word增强功能",
-                "=" * 50,
-                "",
-                "📋 基础功能状态:",
-                f"  ✅ Word文档解析: {'支持' if features.get('basic_parsing') else '不支持'}",
-                "",
-                "🌟 增强功能状态:",
-                f"  {'✅' if has_enhanced else '❌'} 增强解析器: {'可用' if has_enhanced else '不可用'}",
-                f"  {'✅' if features.get('image_extraction') else '❌'} 图片提取: {'支持' if features.get('image_extraction') else '不支持'}",
-                f"  {'✅' if features.get('complex_tables') else '❌'} 复杂表格: {'支持' if features.get('complex_tables') else '不支持'}",
-                f"  {'✅' if features.get('style_preservation') else '❌'} 样式保持: {'支持' if features.get('style_preservation') else '不支持'}",
-                "",
-                "🎯 增强功能详情:",
-                ""
-            ]
-            
-            if has_enhanced:
-                info_lines.extend([
-                    "📷 图片处理功能:",
-                    "  • 自动提取Word文档中的图片",
-                    "  • 支持PNG、JPEG、GIF等格式",
-                    "  • 转换为Base64格式用于Markdown显示",
-                    "  • 保存图片到临时目录供查看",
-                    "",
-                    "📊 复杂表格支持:",
-                    "  • 保持表格结构和格式",
-                    "  • 支持合并单元格的处理",
-                    "  • 识别表头和数据行",
-                    "  • 保持单元格对齐方式",
-                    "  • 提取表格背景色和文字颜色",
-                    "",
-                    "🎨 样式保持功能:",
-                    "  • 识别段落样式信息",
-                    "  • 保持字体、字号、颜色",
-                    "  • 处理粗体、斜体、下划线",
-                    "  • 保持段落对齐和缩进",
-                    "  • 转换为对应的Markdown格式",
-                    "",
-                    "✨ 智能解析特性:",
-                    "  • 多级标题层次识别",
-                    "  • 项目符号和编号列表",
-                    "  • 引用和特殊段落样式",
-                    "  • 文档元数据提取",
-                    "  • 结构化内容组织"
-                ])
-            else:
-                info_lines.extend([
-                    "⚠️ 增强功能不可用",
-                    "",
-                    "可能的原因:",
-                    "  • 缺少必要的依赖库 (Pillow, lxml)",
-                    "  • 增强解析器模块加载失败",
-                    "",
-                    "解决方案:",
-                    "  1. 确保已安装所有依赖: pip install Pillow lxml",
-                    "  2. 重启应用程序",
-                    "  3. 检查enhanced_word_parser.py是否存在"
-                ])
-            
-            info_lines.extend([
-                "",
-                "📖 使用建议:",
-                "  • 优先使用.docx格式的Word文档",
-                "  • 使用标准的内置样式（标题1、标题2等）",
-                "  • 避免过于复杂的嵌套表格",
-                "  • 图片建议使用常见格式（PNG、JPEG）",
-                "",
-                "💡 提示: 通过菜单'Word处理 → 测试Word功能'可以运行完整测试"
-            ])
+            # 功能支持状态在运行期间不变，信息内容只生成一次
+            if self._word_features_info is None:
+                self._word_features_info = self._build_word_features_info()
             
             # 显示信息对话框
             QMessageBox.information(
                 self,
                 "Word增强功能",
-                "\n".join(info_lines)
+                self._word_features_info
             )
             
         except Exception as e:
@@ -1464,7 +1764,34 @@ AI文档管理系统是一个基于PyQt6的智能文档管理平台，集成了W
                 "错误",
                 f"获取增强功能信息失败: {str(e)}"
             )
-
+    
+    def _build_word_features_info(self) -> str:
+        """生成Word增强功能信息"""
+        features = self.word_parser.get_supported_features()
+        has_enhanced = self.word_parser.has_enhanced_features()
+        basic_parsing = features.get('basic_parsing')
+        image_extraction = features.get('image_extraction')
+        complex_tables = features.get('complex_tables')
+        style_preservation = features.get('style_preservation')
+        
+        status_lines = "\n".join([
+            "🚀 AI文档管理系统 - Word增强功能",
+            "=" * 50,
+            "",
+            "📋 基础功能状态:",
+            f"  ✅ Word文档解析: {'支持' if basic_parsing else '不支持'}",
+            "",
+            "🌟 增强功能状态:",
+            f"  {'✅' if has_enhanced else '❌'} 增强解析器: {'可用' if has_enhanced else '不可用'}",
+            f"  {'✅' if image_extraction else '❌'} 图片提取: {'支持' if image_extraction else '不支持'}",
+            f"  {'✅' if complex_tables else '❌'} 复杂表格: {'支持' if complex_tables else '不支持'}",
+            f"  {'✅' if style_preservation else '❌'} 样式保持: {'支持' if style_preservation else '不支持'}",
+            "",
+            "🎯 增强功能详情:",
+            ""
+        ])
+        details = _WORD_ENHANCED_DETAILS if has_enhanced else _WORD_ENHANCED_UNAVAILABLE
+        return "\n".join([status_lines, details, _WORD_USAGE_TIPS])
 
 def main():
     """主函数"""
@@ -1474,6 +1801,7 @@ def main():
     app.setApplicationName(APP_NAME)
     app.setApplicationVersion(APP_VERSION)
     app.setOrganizationName(APP_NAME)
+    QPixmapCache.setCacheLimit(PIXMAP_CACHE_LIMIT)
     
     # 创建并显示主窗口
     window = MainWindow()
@@ -2,34 +2,267 @@
 模板管理器GUI界面
 提供模板的可视化管理功能
 """
+import re
 import sys
+from collections import OrderedDict
+from hashlib import blake2b
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, List, Optional, Any, Callable
 from PyQt6.QtWidgets import (
-    QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
-    QTreeWidget, QTreeWidgetItem, QTextEdit, QLabel, QLineEdit,
-    QPushButton, QSplitter, QGroupBox, QComboBox, QSpinBox,
-    QTabWidget, QListWidget, QListWidgetItem, QDialog, QDialogButtonBox,
-    QFormLayout, QMessageBox, QFileDialog, QToolBar, QMenuBar,
-    QStatusBar, QProgressBar, QCheckBox, QSlider, QScrollArea
+    QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
+    QTreeView, QTextEdit, QLabel, QLineEdit,
+    QPushButton, QSplitter, QGroupBox, QComboBox,
+    QTabWidget, QListWidget, QListWidgetItem,
+    QFormLayout, QMessageBox, QFileDialog, QToolBar, QStatusBar, QProgressBar
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QTimer
-from PyQt6.QtGui import QAction, QIcon, QFont, QPixmap, QTextCursor
+from PyQt6.QtCore import (
+    Qt, QThread, pyqtSignal, QTimer, QAbstractItemModel, QModelIndex
+)
+from PyQt6.QtGui import QAction, QFont
 
-# 添加项目路径
+# 添加项目路径（直接运行本模块时需要）
 sys.path.append(str(Path(__file__).parent.parent.parent))
 
-from config.settings import Settings
-from src.core.template_manager import TemplateManager, TemplateMetadata
+if TYPE_CHECKING:
+    from src.core.template_manager import TemplateIndexEntry
+
+# 搜索过滤合并间隔（毫秒）
+FILTER_UPDATE_INTERVAL = 150
+
+# 内容修改提示合并间隔（毫秒）
+CONTENT_CHANGE_INTERVAL = 150
+
+# 变量检测结果缓存的最大条目数
+VARIABLE_CACHE_SIZE = 64
+
+# 标签分隔符（逗号及其两侧空白）
+_TAG_SPLIT = re.compile(r'\s*,\s*')
+
+# 预览使用的示例上下文（只读）
+_PREVIEW_CONTEXT = MappingProxyType({
+    'date': '2025-07-04',
+    'author': '示例作者',
+    'topic': '示例主题',
+    'weather': '晴朗',
+    'mood': '开心',
+    'project_name': '示例项目',
+    'researcher': '示例研究者',
+    'priority': '高',
+    'project_manager': '示例项目经理',
+    'status': '进行中'
+})
+
+
+class TemplateTreeModel(QAbstractItemModel):
+    """模板树模型：分类 -> 模板两级结构，视图只创建可见行"""
+    
+    HEADERS = ("模板", "信息")
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # [(分类名, [模板索引, ...]), ...]，按首次出现的顺序排列
+        self._categories: List[tuple] = []
+        self._category_rows: Dict[str, int] = {}
+        # 与 _categories 对应的小写模板名称，供搜索过滤使用
+        self._names_lc: List[List[str]] = []
+        # 模板ID -> (所属分类名, 分类下的行号)
+        self._template_locations: Dict[str, tuple] = {}
+    
+    def set_templates(self, templates: List['TemplateIndexEntry']):
+        """按分类重新组织模板并整体刷新视图"""
+        grouped: Dict[str, List['TemplateIndexEntry']] = {}
+        for template in templates:
+            grouped.setdefault(template.category, []).append(template)
+        
+        self.beginResetModel()
+        self._categories = list(grouped.items())
+        self._category_rows = {name: row for row, (name, _) in enumerate(self._categories)}
+        self._names_lc = [[template.name.lower() for template in items] for _, items in self._categories]
+        self._template_locations = {
+            template.id: (name, row)
+            for name, items in self._categories
+            for row, template in enumerate(items)
+        }
+        self.endResetModel()
+    
+    def index_for_id(self, template_id: str) -> QModelIndex:
+        """模板ID对应的索引，不存在时返回无效索引"""
+        location = self._template_locations.get(template_id)
+        if location is None:
+            return QModelIndex()
+        category, row = location
+        return self.index(row, 0, self.index(self._category_rows[category], 0))
+    
+    def upsert_template(self, template: 'TemplateIndexEntry'):
+        """新增或更新单个模板行，不重建整个模型"""
+        template_id = template.id
+        category = template.category
+        location = self._template_locations.get(template_id)
+        
+        if location is not None and location[0] == category:
+            # 分类未变，原位更新
+            category_row = self._category_rows[category]
+            row = location[1]
+            self._categories[category_row][1][row] = template
+            self._names_lc[category_row][row] = template.name.lower()
+            parent = self.index(category_row, 0)
+            self.dataChanged.emit(self.index(row, 0, parent), self.index(row, len(self.HEADERS) - 1, parent))
+            return
+        
+        if location is not None:
+            self.remove_template(template_id)
+        
+        # 分类不存在时先添加分类行
+        if category not in self._category_rows:
+            category_row = len(self._categories)
+            self.beginInsertRows(QModelIndex(), category_row, category_row)
+            self._categories.append((category, []))
+            self._names_lc.append([])
+            self._category_rows[category] = category_row
+            self.endInsertRows()
+        
+        category_row = self._category_rows[category]
+        items = self._categories[category_row][1]
+        self.beginInsertRows(self.index(category_row, 0), len(items), len(items))
+        self._template_locations[template_id] = (category, len(items))
+        items.append(template)
+        self._names_lc[category_row].append(template.name.lower())
+        self.endInsertRows()
+    
+    def remove_template(self, template_id: str):
+        """移除单个模板行，分类为空时一并移除"""
+        location = self._template_locations.pop(template_id, None)
+        if location is None:
+            return
+        
+        category, row = location
+        category_row = self._category_rows[category]
+        items = self._categories[category_row][1]
+        self.beginRemoveRows(self.index(category_row, 0), row, row)
+        del items[row]
+        del self._names_lc[category_row][row]
+        # 后续模板行号前移
+        for later_row in range(row, len(items)):
+            self._template_locations[items[later_row].id] = (category, later_row)
+        self.endRemoveRows()
+        
+        if not self._categories[category_row][1]:
+            self.beginRemoveRows(QModelIndex(), category_row, category_row)
+            del self._categories[category_row]
+            del self._names_lc[category_row]
+            self._category_rows = {name: row for row, (name, _) in enumerate(self._categories)}
+            self.endRemoveRows()
+    
+    def category_rows(self) -> Dict[str, int]:
+        """分类名 -> 行号"""
+        return self._category_rows
+    
+    def lowercase_names(self, category_row: int) -> List[str]:
+        """指定分类下各模板的小写名称"""
+        return self._names_lc[category_row]
+    
+    def template_count(self) -> int:
+        """模板总数"""
+        return sum(len(items) for _, items in self._categories)
+    
+    def is_template(self, index: QModelIndex) -> bool:
+        """索引是否指向模板项（而非分类项）"""
+        return index.isValid() and index.internalPointer() is not None
+    
+    def index(self, row: int, column: int, parent: QModelIndex = QModelIndex()) -> QModelIndex:
+        if not self.hasIndex(row, column, parent):
+            return QModelIndex()
+        if not parent.isValid():
+            return self.createIndex(row, column, None)
+        # 模板项以所属分类节点作为内部指针
+        return self.createIndex(row, column, self._categories[parent.row()])
+    
+    def parent(self, index: Optional[QModelIndex] = None) -> Any:
+        # Python 重写会遮蔽 QObject.parent() 重载，无参数调用时转交给它
+        if index is None:
+            return super().parent()
+        if not index.isValid():
+            return QModelIndex()
+        node = index.internalPointer()
+        if node is None:
+            return QModelIndex()
+        return self.createIndex(self._category_rows[node[0]], 0, None)
+    
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.column() > 0:
+            return 0
+        if not parent.isValid():
+            return len(self._categories)
+        if parent.internalPointer() is None:
+            return len(self._categories[parent.row()][1])
+        return 0
+    
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return len(self.HEADERS)
+    
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        node = index.internalPointer()
+        if node is None:
+            if role == Qt.ItemDataRole.DisplayRole and index.column() == 0:
+                return self._categories[index.row()][0]
+            return None
+        
+        template = node[1][index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            if index.column() == 0:
+                return template.name
+            return f"v{template.version}"
+        if role == Qt.ItemDataRole.UserRole:
+            return template.id
+        return None
+    
+    def headerData(self, section: int, orientation: Qt.Orientation,
+                   role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+
+class TemplateFileWorker(QThread):
+    """模板文件读写线程"""
+    
+    done = pyqtSignal(object)  # 任务返回值
+    failed = pyqtSignal(str)
+    
+    def __init__(self, task: Callable[[], Any]):
+        super().__init__()
+        self.task = task
+    
+    def run(self):
+        """执行文件任务"""
+        try:
+            result = self.task()
+        except Exception as e:
+            self.failed.emit(str(e))
+            return
+        self.done.emit(result)
+
 
 class TemplateManagerGUI(QMainWindow):
     """模板管理器主界面"""
     
     def __init__(self):
         super().__init__()
+        # 配置和模板管理模块在创建窗口时再加载，导入本模块不产生额外开销
+        from config.settings import Settings
+        from src.core.template_manager import TemplateManager
+        
         self.settings = Settings()
         self.template_manager = TemplateManager(self.settings.templates_dir)
         self.current_template_id = None
+        # 内容摘要 -> 检测到的变量名列表
+        self._var_cache: "OrderedDict[bytes, List[str]]" = OrderedDict()
+        self._file_worker: Optional[TemplateFileWorker] = None
+        self._dirty = False  # 编辑器内容是否有未保存的修改
+        self._search_active = False  # 是否有模板行被搜索过滤隐藏
         self.init_ui()
         self.load_templates()
     
@@ -77,7 +310,12 @@ class TemplateManagerGUI(QMainWindow):
         search_layout = QHBoxLayout()
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("搜索模板...")
-        self.search_input.textChanged.connect(self.filter_templates)
+        # 连续输入合并为一次过滤
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(FILTER_UPDATE_INTERVAL)
+        self._filter_timer.timeout.connect(self._apply_filter)
+        self.search_input.textChanged.connect(self._filter_timer.start)
         search_layout.addWidget(QLabel("搜索:"))
         search_layout.addWidget(self.search_input)
         left_layout.addLayout(search_layout)
@@ -92,10 +330,15 @@ class TemplateManagerGUI(QMainWindow):
         left_layout.addLayout(category_layout)
         
         # 模板列表
-        self.template_list = QTreeWidget()
-        self.template_list.setHeaderLabels(["模板", "信息"])
-        self.template_list.itemClicked.connect(self.on_template_selected)
+        self.template_model = TemplateTreeModel(self)
+        self.template_list = QTreeView()
+        self.template_list.setModel(self.template_model)
+        self.template_list.selectionModel().currentChanged.connect(self.on_template_selected)
         self.template_list.setAlternatingRowColors(True)
+        # 行高统一，布局时无需逐行计算；分类默认折叠，展开时才布局子项
+        self.template_list.setUniformRowHeights(True)
+        self.template_list.setItemsExpandable(True)
+        self.template_list.setExpandsOnDoubleClick(True)
         left_layout.addWidget(self.template_list)
         
         # 操作按钮
@@ -157,7 +400,12 @@ class TemplateManagerGUI(QMainWindow):
         
         self.content_editor = QTextEdit()
         self.content_editor.setFont(QFont("Consolas", 10))
-        self.content_editor.textChanged.connect(self.on_content_changed)
+        # 连续输入合并为一次处理，处理时才需要读取编辑器内容
+        self._content_timer = QTimer(self)
+        self._content_timer.setSingleShot(True)
+        self._content_timer.setInterval(CONTENT_CHANGE_INTERVAL)
+        self._content_timer.timeout.connect(self.on_content_changed)
+        self.content_editor.textChanged.connect(self._content_timer.start)
         content_layout.addWidget(self.content_editor)
         
         self.tab_widget.addTab(self.content_tab, "内容编辑")
@@ -295,68 +543,119 @@ class TemplateManagerGUI(QMainWindow):
         self.status_bar = QStatusBar()
         self.setStatusBar(self.status_bar)
         self.status_bar.showMessage("就绪")
+        
+        # 文件读写进行中的忙碌指示
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setRange(0, 0)
+        self.progress_bar.setMaximumWidth(120)
+        self.progress_bar.hide()
+        self.status_bar.addPermanentWidget(self.progress_bar)
     
     def load_templates(self):
         """加载模板列表"""
-        self.template_list.clear()
+        # 元数据文件未变化时直接使用内存中的模板信息
+        self.template_manager.reload_if_changed()
         
-        # 加载分类
-        categories = self.template_manager.get_categories()
-        self.category_combo.clear()
-        self.category_combo.addItem("全部分类")
-        self.category_combo.addItems(categories)
-        
-        # 按分类组织模板
-        templates = self.template_manager.list_templates()
-        category_items = {}
-        
-        for template in templates:
-            category = template.get('category', '其他')
-            
-            # 创建分类项
-            if category not in category_items:
-                category_item = QTreeWidgetItem(self.template_list)
-                category_item.setText(0, category)
-                category_item.setExpanded(True)
-                category_items[category] = category_item
+        # 重建期间暂停重绘，完成后统一刷新
+        self.template_list.setUpdatesEnabled(False)
+        try:
+            # 加载分类
+            self._load_categories()
             
-            # 创建模板项
-            template_item = QTreeWidgetItem(category_items[category])
-            template_item.setText(0, template['name'])
-            template_item.setText(1, f"v{template['version']}")
-            template_item.setData(0, Qt.ItemDataRole.UserRole, template['id'])
+            # 按分类组织模板，由模型一次性刷新视图
+            templates = self.template_manager.list_index()
+            self.template_model.set_templates(templates)
+            # 模型重置会清除隐藏状态，重新应用分类过滤
+            self.filter_by_category(self.category_combo.currentText())
+        finally:
+            self.template_list.setUpdatesEnabled(True)
         
         self.status_bar.showMessage(f"已加载 {len(templates)} 个模板")
     
+    def _load_categories(self):
+        """加载分类下拉框（分类未变化时不重建）"""
+        combo = self.category_combo
+        new_categories = ["全部分类"] + self.template_manager.get_categories()
+        if new_categories == [combo.itemText(i) for i in range(combo.count())]:
+            return
+        
+        # 重建期间屏蔽信号，尽量保留当前选择的分类
+        current = combo.currentText()
+        combo.blockSignals(True)
+        combo.clear()
+        combo.addItems(new_categories)
+        combo.setCurrentIndex(max(combo.findText(current), 0))
+        combo.blockSignals(False)
+        if combo.currentText() != current:
+            self.filter_by_category(combo.currentText())
+    
+    def _refresh_template_row(self, template_id: str):
+        """保存后只更新对应的模板行"""
+        template = self.template_manager.get_index_entry(template_id)
+        if template is None:
+            self.load_templates()
+            return
+        self.template_model.upsert_template(template)
+        self._load_categories()
+    
+    def select_template(self, template_id: str):
+        """按模板ID选中模板"""
+        index = self.template_model.index_for_id(template_id)
+        if index.isValid():
+            self.template_list.setCurrentIndex(index)
+            self.template_list.scrollTo(index)
+    
+    def _apply_filter(self):
+        """按搜索框当前内容过滤模板"""
+        self.filter_templates(self.search_input.text())
+    
     def filter_templates(self, text):
         """过滤模板"""
-        for i in range(self.template_list.topLevelItemCount()):
-            category_item = self.template_list.topLevelItem(i)
-            category_visible = False
-            
-            for j in range(category_item.childCount()):
-                template_item = category_item.child(j)
-                template_name = template_item.text(0).lower()
-                visible = text.lower() in template_name
-                template_item.setHidden(not visible)
-                if visible:
-                    category_visible = True
+        model = self.template_model
+        needle = text.lower()
+        self.template_list.setUpdatesEnabled(False)
+        try:
+            if not needle:
+                # 清空搜索：无需逐项匹配，之前未过滤过的模板行也无需处理
+                for i in model.category_rows().values():
+                    self.template_list.setRowHidden(i, QModelIndex(), False)
+                    if self._search_active:
+                        category_index = model.index(i, 0)
+                        for j in range(model.rowCount(category_index)):
+                            self.template_list.setRowHidden(j, category_index, False)
+                self._search_active = False
+                return
             
-            category_item.setHidden(not category_visible)
+            self._search_active = True
+            for i in model.category_rows().values():
+                category_index = model.index(i, 0)
+                category_visible = False
+                
+                for j, template_name in enumerate(model.lowercase_names(i)):
+                    visible = needle in template_name
+                    self.template_list.setRowHidden(j, category_index, not visible)
+                    if visible:
+                        category_visible = True
+                
+                self.template_list.setRowHidden(i, QModelIndex(), not category_visible)
+        finally:
+            self.template_list.setUpdatesEnabled(True)
     
     def filter_by_category(self, category):
         """按分类过滤"""
-        for i in range(self.template_list.topLevelItemCount()):
-            category_item = self.template_list.topLevelItem(i)
-            if category == "全部分类":
-                category_item.setHidden(False)
-            else:
-                category_item.setHidden(category_item.text(0) != category)
+        model = self.template_model
+        self.template_list.setUpdatesEnabled(False)
+        try:
+            show_all = category == "全部分类"
+            for category_name, i in model.category_rows().items():
+                self.template_list.setRowHidden(i, QModelIndex(), not show_all and category_name != category)
+        finally:
+            self.template_list.setUpdatesEnabled(True)
     
-    def on_template_selected(self, item):
+    def on_template_selected(self, index: QModelIndex):
         """模板选择事件"""
-        if item.parent():  # 是模板项，不是分类项
-            template_id = item.data(0, Qt.ItemDataRole.UserRole)
+        if self.template_model.is_template(index):  # 是模板项，不是分类项
+            template_id = index.siblingAtColumn(0).data(Qt.ItemDataRole.UserRole)
             self.load_template(template_id)
     
     def load_template(self, template_id):
@@ -376,7 +675,7 @@ class TemplateManagerGUI(QMainWindow):
         self.tags_input.setText(', '.join(metadata['tags']))
         
         # 填充内容
-        self.content_editor.setPlainText(content)
+        self._set_editor_content(content, dirty=False)
         
         # 更新变量列表
         self.update_variables_list(metadata['variables'])
@@ -398,7 +697,7 @@ class TemplateManagerGUI(QMainWindow):
         self.category_input.setCurrentText("")
         self.description_input.clear()
         self.tags_input.clear()
-        self.content_editor.clear()
+        self._set_editor_content("", dirty=False)
         self.variables_list.clear()
         self.preview_display.clear()
         self.status_bar.showMessage("新建模板")
@@ -415,7 +714,7 @@ class TemplateManagerGUI(QMainWindow):
             category = "自定义"
         
         description = self.description_input.toPlainText().strip()
-        tags = [tag.strip() for tag in self.tags_input.text().split(',') if tag.strip()]
+        tags = [tag for tag in _TAG_SPLIT.split(self.tags_input.text().strip()) if tag]
         content = self.content_editor.toPlainText()
         
         try:
@@ -431,8 +730,9 @@ class TemplateManagerGUI(QMainWindow):
                     self.current_template_id, content, metadata_updates
                 )
                 if success:
+                    self._dirty = False
                     QMessageBox.information(self, "成功", "模板已更新")
-                    self.load_templates()
+                    self._refresh_template_row(self.current_template_id)
                 else:
                     QMessageBox.warning(self, "错误", "模板更新失败")
             else:
@@ -441,9 +741,10 @@ class TemplateManagerGUI(QMainWindow):
                     name, content, category, description, tags
                 )
                 if template_id:
+                    self._dirty = False
                     self.current_template_id = template_id
                     QMessageBox.information(self, "成功", "模板已创建")
-                    self.load_templates()
+                    self._refresh_template_row(template_id)
                 else:
                     QMessageBox.warning(self, "错误", "模板创建失败")
         except Exception as e:
@@ -451,13 +752,14 @@ class TemplateManagerGUI(QMainWindow):
     
     def delete_template(self):
         """删除模板"""
-        current_item = self.template_list.currentItem()
-        if not current_item or not current_item.parent():
+        current_index = self.template_list.currentIndex()
+        if not self.template_model.is_template(current_index):
             QMessageBox.warning(self, "警告", "请选择要删除的模板")
             return
         
-        template_id = current_item.data(0, Qt.ItemDataRole.UserRole)
-        template_name = current_item.text(0)
+        current_index = current_index.siblingAtColumn(0)
+        template_id = current_index.data(Qt.ItemDataRole.UserRole)
+        template_name = current_index.data()
         
         reply = QMessageBox.question(
             self, "确认删除", 
@@ -468,11 +770,32 @@ class TemplateManagerGUI(QMainWindow):
         if reply == QMessageBox.StandardButton.Yes:
             if self.template_manager.delete_template(template_id):
                 QMessageBox.information(self, "成功", "模板已删除")
-                self.load_templates()
+                self.template_model.remove_template(template_id)
+                self._load_categories()
                 self.new_template()  # 清空编辑器
             else:
                 QMessageBox.warning(self, "错误", "删除失败")
     
+    def _start_file_task(self, task: Callable[[], Any], on_done: Callable[[Any], None], error_prefix: str) -> bool:
+        """在后台线程中执行文件读写任务"""
+        if self._file_worker is not None:
+            QMessageBox.information(self, "提示", "正在处理其他文件操作，请稍候")
+            return False
+        
+        worker = TemplateFileWorker(task)
+        worker.done.connect(on_done)
+        worker.failed.connect(lambda error: QMessageBox.critical(self, "错误", f"{error_prefix}: {error}"))
+        worker.finished.connect(self._on_file_task_finished)
+        self._file_worker = worker
+        self.progress_bar.show()
+        worker.start()
+        return True
+    
+    def _on_file_task_finished(self):
+        """文件任务结束"""
+        self._file_worker = None
+        self.progress_bar.hide()
+    
     def import_template(self):
         """导入模板"""
         file_path, _ = QFileDialog.getOpenFileName(
@@ -480,43 +803,60 @@ class TemplateManagerGUI(QMainWindow):
         )
         
         if file_path:
-            try:
-                template_id = self.template_manager.import_template(Path(file_path))
-                if template_id:
-                    QMessageBox.information(self, "成功", "模板导入成功")
-                    self.load_templates()
-                else:
-                    QMessageBox.warning(self, "错误", "模板导入失败")
-            except Exception as e:
-                QMessageBox.critical(self, "错误", f"导入失败: {str(e)}")
+            path = Path(file_path)
+            # 后台线程只读取文件，模板元数据在界面线程中更新
+            if self._start_file_task(lambda: path.read_text(encoding='utf-8'),
+                                     lambda content: self._on_import_done(path, content), "导入失败"):
+                self.status_bar.showMessage(f"正在导入: {path.name}")
+    
+    def _on_import_done(self, path: Path, content: str):
+        """导入文件读取完成，创建模板"""
+        template_id = self.template_manager.create_template(
+            path.stem, content, "导入", f"从 {path.name} 导入"
+        )
+        if template_id:
+            QMessageBox.information(self, "成功", "模板导入成功")
+            self.load_templates()
+        else:
+            QMessageBox.warning(self, "错误", "模板导入失败")
     
     def export_template(self):
         """导出模板"""
-        current_item = self.template_list.currentItem()
-        if not current_item or not current_item.parent():
+        current_index = self.template_list.currentIndex()
+        if not self.template_model.is_template(current_index):
             QMessageBox.warning(self, "警告", "请选择要导出的模板")
             return
         
-        template_id = current_item.data(0, Qt.ItemDataRole.UserRole)
-        template_name = current_item.text(0)
+        current_index = current_index.siblingAtColumn(0)
+        template_id = current_index.data(Qt.ItemDataRole.UserRole)
+        template_name = current_index.data()
         
         file_path, _ = QFileDialog.getSaveFileName(
             self, "保存模板", f"{template_name}.md", "Markdown文件 (*.md);;文本文件 (*.txt)"
         )
         
         if file_path:
-            try:
-                if self.template_manager.export_template(template_id, Path(file_path)):
-                    QMessageBox.information(self, "成功", "模板导出成功")
-                else:
-                    QMessageBox.warning(self, "错误", "模板导出失败")
-            except Exception as e:
-                QMessageBox.critical(self, "错误", f"导出失败: {str(e)}")
+            metadata = self.template_manager.templates.get(template_id)
+            if metadata is None:
+                QMessageBox.warning(self, "错误", "模板导出失败")
+                return
+            
+            # 在界面线程中确定模板文件，后台线程只负责复制内容
+            source = self.template_manager.templates_dir / metadata['file_path']
+            target = Path(file_path)
+            self._start_file_task(
+                lambda: target.write_text(source.read_text(encoding='utf-8'), encoding='utf-8'),
+                self._on_export_done, "导出失败"
+            )
+    
+    def _on_export_done(self, _):
+        """导出完成"""
+        QMessageBox.information(self, "成功", "模板导出成功")
     
     def detect_variables(self):
         """检测模板变量"""
         content = self.content_editor.toPlainText()
-        variables = self.template_manager.engine.extract_variables(content)
+        variables = self._extract_variables(content)
         
         # 更新变量列表
         self.variables_list.clear()
@@ -533,27 +873,28 @@ class TemplateManagerGUI(QMainWindow):
         
         self.status_bar.showMessage(f"检测到 {len(variables)} 个变量")
     
+    def _extract_variables(self, content: str) -> List[str]:
+        """提取模板变量（按内容摘要缓存）"""
+        key = blake2b(content.encode('utf-8'), digest_size=16).digest()
+        variables = self._var_cache.get(key)
+        if variables is not None:
+            self._var_cache.move_to_end(key)
+            return variables
+        
+        variables = self.template_manager.engine.extract_variables(content)
+        self._var_cache[key] = variables
+        if len(self._var_cache) > VARIABLE_CACHE_SIZE:
+            self._var_cache.popitem(last=False)
+        return variables
+    
     def generate_preview(self):
         """生成预览"""
         if not self.current_template_id:
             QMessageBox.warning(self, "警告", "请先保存模板")
             return
         
-        # 创建示例上下文
-        context = {
-            'date': '2025-07-04',
-            'author': '示例作者',
-            'topic': '示例主题',
-            'weather': '晴朗',
-            'mood': '开心',
-            'project_name': '示例项目',
-            'researcher': '示例研究者',
-            'priority': '高',
-            'project_manager': '示例项目经理',
-            'status': '进行中'
-        }
-        
-        rendered = self.template_manager.render_template(self.current_template_id, context)
+        # 渲染只读取上下文，直接使用示例上下文常量
+        rendered = self.template_manager.render_template(self.current_template_id, _PREVIEW_CONTEXT)
         if rendered:
             self.preview_display.setPlainText(rendered)
             self.status_bar.showMessage("预览已生成")
@@ -567,26 +908,33 @@ class TemplateManagerGUI(QMainWindow):
         )
         
         if file_path:
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                
-                # 在编辑器中显示
-                self.content_editor.setPlainText(content)
-                self.name_input.setText(Path(file_path).stem)
-                self.status_bar.showMessage(f"已打开: {Path(file_path).name}")
-            except Exception as e:
-                QMessageBox.critical(self, "错误", f"打开失败: {str(e)}")
+            path = Path(file_path)
+            self._start_file_task(lambda: path.read_text(encoding='utf-8'),
+                                  lambda content: self._on_template_file_opened(path, content),
+                                  "打开失败")
+    
+    def _on_template_file_opened(self, path: Path, content: str):
+        """模板文件读取完成"""
+        # 在编辑器中显示
+        self._set_editor_content(content, dirty=True)
+        self.name_input.setText(path.stem)
+        self.status_bar.showMessage(f"已打开: {path.name}")
     
     def on_template_info_changed(self):
         """模板信息改变"""
         if hasattr(self, 'current_template_id'):
             self.status_bar.showMessage("模板信息已修改")
     
+    def _set_editor_content(self, content: str, dirty: bool):
+        """以程序方式设置编辑器内容，不触发修改提示"""
+        self.content_editor.setPlainText(content)
+        self._content_timer.stop()
+        self._dirty = dirty
+    
     def on_content_changed(self):
-        """内容改变"""
-        if hasattr(self, 'current_template_id'):
-            self.status_bar.showMessage("模板内容已修改")
+        """内容改变（合并后的连续输入）"""
+        self._dirty = True
+        self.status_bar.showMessage("模板内容已修改")
 
 
 def main():
@@ -2,8 +2,8 @@
 图片查看器组件
 支持Word文档中的图片预览和显示
 """
-import base64
-import tempfile
+import binascii
+import hashlib
 import shutil
 from pathlib import Path
 from typing import Optional
@@ -12,8 +12,8 @@ from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, 
     QScrollArea, QFileDialog, QMessageBox
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QSize
-from PyQt6.QtGui import QPixmap
+from PyQt6.QtCore import Qt, pyqtSignal, QSize, QTimer
+from PyQt6.QtGui import QPixmap, QPixmapCache
 
 try:
     import importlib.util
@@ -22,6 +22,18 @@ except ImportError:
     PILLOW_AVAILABLE = False
 
 
+def _load_cached_pixmap(image_bytes: bytes) -> QPixmap:
+    """解码图片数据，按内容哈希缓存到 QPixmapCache，相同图片只解码一次"""
+    key = "image:" + hashlib.blake2b(image_bytes, digest_size=16).hexdigest()
+    pixmap = QPixmapCache.find(key)
+    if pixmap is None:
+        pixmap = QPixmap()
+        pixmap.loadFromData(image_bytes)
+        if not pixmap.isNull():
+            QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+
 class ImageViewer(QWidget):
     """图片查看器组件"""
     
@@ -29,13 +41,23 @@ class ImageViewer(QWidget):
     image_clicked = pyqtSignal(str)  # 图片被点击
     image_saved = pyqtSignal(str)    # 图片被保存
     
+    # 连续缩放停止后再进行平滑缩放的延迟（毫秒）
+    SMOOTH_SCALE_DELAY = 150
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.image_path = None
-        self.image_data = None
+        self.image_bytes: Optional[bytes] = None  # base64图片解码后的原始数据
+        self._original_pixmap: Optional[QPixmap] = None  # 已解码的原始图片，缩放时复用
         self.scale_factor = 1.0
         self.max_display_size = QSize(400, 300)
         
+        # 缩放过程中使用快速缩放，停止操作后再平滑缩放一次
+        self._smooth_timer = QTimer(self)
+        self._smooth_timer.setSingleShot(True)
+        self._smooth_timer.setInterval(self.SMOOTH_SCALE_DELAY)
+        self._smooth_timer.timeout.connect(self.update_image_display)
+        
         self.setup_ui()
         
     def setup_ui(self):
@@ -105,18 +127,13 @@ class ImageViewer(QWidget):
         """从base64数据加载图片"""
         try:
             # 解码base64数据
-            image_bytes = base64.b64decode(base64_data)
-            
-            # 创建临时文件
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.png') as temp_file:
-                temp_file.write(image_bytes)
-                temp_path = temp_file.name
+            image_bytes = binascii.a2b_base64(base64_data)
             
-            # 加载图片
-            pixmap = QPixmap(temp_path)
+            # 直接在内存中解码图片，无需写临时文件
+            pixmap = _load_cached_pixmap(image_bytes)
             if not pixmap.isNull():
-                self.image_path = temp_path
-                self.image_data = base64_data
+                self.image_path = None
+                self.image_bytes = image_bytes
                 self.display_image(pixmap, filename, width, height, format, description)
                 return True
             else:
@@ -133,7 +150,7 @@ class ImageViewer(QWidget):
             pixmap = QPixmap(file_path)
             if not pixmap.isNull():
                 self.image_path = file_path
-                self.image_data = None
+                self.image_bytes = None
                 
                 # 获取图片信息
                 filename = Path(file_path).name
@@ -164,6 +181,7 @@ class ImageViewer(QWidget):
             pass
             
         # 缩放图片以适应显示区域
+        self._original_pixmap = pixmap
         scaled_pixmap = self.scale_pixmap(pixmap, self.max_display_size)
         self.image_label.setPixmap(scaled_pixmap)
         
@@ -181,49 +199,54 @@ class ImageViewer(QWidget):
         # 启用控制按钮
         self.set_controls_enabled(True)
         
-    def scale_pixmap(self, pixmap: QPixmap, max_size: QSize) -> QPixmap:
+    def scale_pixmap(self, pixmap: QPixmap, max_size: QSize, smooth: bool = True) -> QPixmap:
         """缩放图片以适应指定尺寸"""
-        if pixmap.size().width() <= max_size.width() and pixmap.size().height() <= max_size.height():
+        size = pixmap.size()
+        width, height = size.width(), size.height()
+        max_width, max_height = max_size.width(), max_size.height()
+        if width <= max_width and height <= max_height:
             return pixmap
             
-        return pixmap.scaled(max_size, Qt.AspectRatioMode.KeepAspectRatio, 
-                           Qt.TransformationMode.SmoothTransformation)
+        mode = (Qt.TransformationMode.SmoothTransformation if smooth
+                else Qt.TransformationMode.FastTransformation)
+        return pixmap.scaled(max_size, Qt.AspectRatioMode.KeepAspectRatio, mode)
         
     def zoom_in(self):
         """放大图片"""
         self.scale_factor *= 1.25
-        self.update_image_display()
+        self.update_image_display(smooth=False)
+        self._smooth_timer.start()
         
     def zoom_out(self):
         """缩小图片"""
         self.scale_factor /= 1.25
-        self.update_image_display()
+        self.update_image_display(smooth=False)
+        self._smooth_timer.start()
         
     def fit_to_window(self):
         """适应窗口大小"""
         self.scale_factor = 1.0
+        self._smooth_timer.stop()
         self.update_image_display()
         
-    def update_image_display(self):
+    def update_image_display(self, smooth: bool = True):
         """更新图片显示"""
-        if not self.image_path:
-            return
-            
-        # 重新加载并缩放图片
-        original_pixmap = QPixmap(self.image_path)
-        if not original_pixmap.isNull():
+        original_pixmap = self._original_pixmap
+        if original_pixmap is not None and not original_pixmap.isNull():
             # 计算新尺寸
+            max_size = self.max_display_size
+            scale_factor = self.scale_factor
             new_size = QSize(
-                int(self.max_display_size.width() * self.scale_factor),
-                int(self.max_display_size.height() * self.scale_factor)
+                int(max_size.width() * scale_factor),
+                int(max_size.height() * scale_factor)
             )
             
-            scaled_pixmap = self.scale_pixmap(original_pixmap, new_size)
+            scaled_pixmap = self.scale_pixmap(original_pixmap, new_size, smooth)
             self.image_label.setPixmap(scaled_pixmap)
             
     def save_image(self):
         """保存图片"""
-        if not self.image_path and not self.image_data:
+        if not self.image_path and self.image_bytes is None:
             QMessageBox.warning(self, "警告", "没有图片可以保存")
             return
             
@@ -235,11 +258,10 @@ class ImageViewer(QWidget):
         
         if file_path:
             try:
-                if self.image_data:
-                    # 从base64数据保存
-                    image_bytes = base64.b64decode(self.image_data)
+                if self.image_bytes is not None:
+                    # 直接写出加载时已解码的数据
                     with open(file_path, 'wb') as f:
-                        f.write(image_bytes)
+                        f.write(self.image_bytes)
                 else:
                     # 从文件复制
                     if self.image_path:
@@ -271,7 +293,9 @@ class ImageViewer(QWidget):
         self.image_label.setText("无图片")
         self.info_label.clear()
         self.image_path = None
-        self.image_data = None
+        self.image_bytes = None
+        self._original_pixmap = None
+        self._smooth_timer.stop()
         self.scale_factor = 1.0
         self.set_controls_enabled(False)
 
@@ -317,9 +341,8 @@ class ImagePreviewWidget(QWidget):
             
             if base64_data:
                 # 从base64加载
-                image_bytes = base64.b64decode(base64_data)
-                pixmap = QPixmap()
-                pixmap.loadFromData(image_bytes)
+                image_bytes = binascii.a2b_base64(base64_data)
+                pixmap = _load_cached_pixmap(image_bytes)
                 
             elif file_path:
                 # 从文件加载
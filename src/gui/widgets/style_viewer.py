@@ -2,14 +2,16 @@
 样式查看器组件
 支持Word文档中的样式信息显示和预览
 """
-from typing import List, Dict
+import re
+from collections import Counter
+from typing import List, Dict, FrozenSet, Optional, Tuple
 
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QTextEdit,
     QFrame, QGroupBox, QListWidget, QListWidgetItem,
     QPushButton, QSplitter, QComboBox, QCheckBox
 )
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer
 from PyQt6.QtGui import QFont, QColor, QTextCharFormat, QTextCursor, QBrush
 
 from src.core.enhanced_word_parser import StyleInfo, ParagraphInfo
@@ -22,11 +24,26 @@ class StyleViewer(QWidget):
     style_selected = pyqtSignal(str)  # 样式被选中
     style_applied = pyqtSignal(str)   # 样式被应用
     
+    # 按样式名称关键词判断样式类型
+    _PARA_RE = re.compile('标题|正文|段落|列表|引用')
+    _CHAR_RE = re.compile('强调|字符|超链接|代码')
+    _TABLE_RE = re.compile('表格|网格|列表')
+    
+    # 过滤条件连续变化时合并为一次列表刷新的延迟（毫秒）
+    FILTER_DELAY = 50
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.styles_data = {}
         self.paragraphs_data = []
         self.current_style = None
+        # 加载时预先计算，过滤时直接查表
+        self._style_types: Dict[str, FrozenSet[str]] = {}  # 样式名 -> 所属的过滤类型
+        self._used_styles: Dict[str, int] = {}
+        self._paragraphs_by_style: Dict[str, List[Tuple[int, ParagraphInfo]]] = {}  # 样式名 -> (段落序号, 段落)
+        self._usage_labels_by_style: Dict[str, List[str]] = {}  # 样式名 -> 段落条目文本，首次查看时生成
+        # 预览字符格式缓存，键为样式名称，加载新样式时清空
+        self._char_format_cache: Dict[str, QTextCharFormat] = {}
         
         self.setup_ui()
         
@@ -58,13 +75,18 @@ class StyleViewer(QWidget):
         # 过滤选项
         filter_layout = QHBoxLayout()
         
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(self.FILTER_DELAY)
+        self._filter_timer.timeout.connect(self.filter_styles)
+        
         self.filter_combo = QComboBox()
         self.filter_combo.addItems(["所有样式", "段落样式", "字符样式", "表格样式"])
-        self.filter_combo.currentTextChanged.connect(self.filter_styles)
+        self.filter_combo.currentTextChanged.connect(self._filter_timer.start)
         filter_layout.addWidget(self.filter_combo)
         
         self.show_used_only_cb = QCheckBox("仅显示使用的样式")
-        self.show_used_only_cb.toggled.connect(self.filter_styles)
+        self.show_used_only_cb.toggled.connect(self._filter_timer.start)
         filter_layout.addWidget(self.show_used_only_cb)
         
         layout.addLayout(filter_layout)
@@ -121,6 +143,17 @@ class StyleViewer(QWidget):
         """加载样式数据"""
         self.styles_data = styles_data
         self.paragraphs_data = paragraphs_data
+        self._used_styles = self.get_used_styles()
+        self._style_types = {style_name: self.classify_style(style_name) for style_name in styles_data}
+        self._char_format_cache.clear()
+        
+        # 按样式名称建立段落索引，点击样式时无需遍历全部段落
+        self._paragraphs_by_style = {}
+        self._usage_labels_by_style = {}
+        for i, paragraph in enumerate(paragraphs_data):
+            # 这里简化处理，假设有样式名称信息
+            paragraph_style = getattr(paragraph, 'style_name', '正文')
+            self._paragraphs_by_style.setdefault(paragraph_style, []).append((i, paragraph))
         
         # 更新样式列表
         self.update_style_list()
@@ -130,28 +163,22 @@ class StyleViewer(QWidget):
         
     def update_style_list(self):
         """更新样式列表"""
-        self.style_list.clear()
-        
         # 获取过滤条件
         filter_type = self.filter_combo.currentText()
         show_used_only = self.show_used_only_cb.isChecked()
         
-        # 统计样式使用情况
-        used_styles = self.get_used_styles()
+        # 样式使用情况（加载时已统计）
+        used_styles = self._used_styles
         
+        items = []
         for style_name, style_info in self.styles_data.items():
             # 应用过滤
             if show_used_only and style_name not in used_styles:
                 continue
                 
-            # 类型过滤（这里简化处理，根据样式名称判断）
-            if filter_type != "所有样式":
-                if filter_type == "段落样式" and not self.is_paragraph_style(style_name):
-                    continue
-                elif filter_type == "字符样式" and not self.is_character_style(style_name):
-                    continue
-                elif filter_type == "表格样式" and not self.is_table_style(style_name):
-                    continue
+            # 类型过滤（加载时已按样式名称分类）
+            if filter_type != "所有样式" and filter_type not in self._style_types[style_name]:
+                continue
             
             # 创建列表项
             item = QListWidgetItem(style_name)
@@ -165,33 +192,46 @@ class StyleViewer(QWidget):
                 count = used_styles[style_name]
                 item.setText(f"{style_name} ({count})")
             
-            self.style_list.addItem(item)
+            items.append(item)
+            
+        # 整体替换列表内容，期间不重绘、不发出信号
+        self.style_list.setUpdatesEnabled(False)
+        self.style_list.blockSignals(True)
+        try:
+            self.style_list.clear()
+            for item in items:
+                self.style_list.addItem(item)
+        finally:
+            self.style_list.blockSignals(False)
+            self.style_list.setUpdatesEnabled(True)
             
     def get_used_styles(self) -> Dict[str, int]:
         """获取使用的样式统计"""
-        used_styles = {}
-        
-        for paragraph in self.paragraphs_data:
-            # 这里简化处理，假设有样式名称信息
-            style_name = getattr(paragraph, 'style_name', '正文')
-            used_styles[style_name] = used_styles.get(style_name, 0) + 1
-            
-        return used_styles
+        # 这里简化处理，假设有样式名称信息
+        return Counter(getattr(paragraph, 'style_name', '正文') for paragraph in self.paragraphs_data)
+        
+    def classify_style(self, style_name: str) -> FrozenSet[str]:
+        """根据样式名称判断所属的过滤类型（可同时属于多种）"""
+        style_types = set()
+        if self.is_paragraph_style(style_name):
+            style_types.add("段落样式")
+        if self.is_character_style(style_name):
+            style_types.add("字符样式")
+        if self.is_table_style(style_name):
+            style_types.add("表格样式")
+        return frozenset(style_types)
         
     def is_paragraph_style(self, style_name: str) -> bool:
         """判断是否为段落样式"""
-        paragraph_keywords = ['标题', '正文', '段落', '列表', '引用']
-        return any(keyword in style_name for keyword in paragraph_keywords)
+        return self._PARA_RE.search(style_name) is not None
         
     def is_character_style(self, style_name: str) -> bool:
         """判断是否为字符样式"""
-        character_keywords = ['强调', '字符', '超链接', '代码']
-        return any(keyword in style_name for keyword in character_keywords)
+        return self._CHAR_RE.search(style_name) is not None
         
     def is_table_style(self, style_name: str) -> bool:
         """判断是否为表格样式"""
-        table_keywords = ['表格', '网格', '列表']
-        return any(keyword in style_name for keyword in table_keywords)
+        return self._TABLE_RE.search(style_name) is not None
         
     def set_item_preview_style(self, item: QListWidgetItem, style_info: StyleInfo):
         """设置列表项预览样式"""
@@ -231,19 +271,27 @@ class StyleViewer(QWidget):
         style_info = item.data(Qt.ItemDataRole.UserRole)
         if isinstance(style_info, StyleInfo):
             self.current_style = item.text().split(' (')[0]  # 去掉使用次数
-            self.show_style_preview(style_info)
+            self.show_style_preview(style_info, self.current_style)
             self.show_style_details(style_info)
             self.show_style_usage(self.current_style)
             self.apply_btn.setEnabled(True)
             self.style_selected.emit(self.current_style)
             
-    def show_style_preview(self, style_info: StyleInfo):
+    def show_style_preview(self, style_info: StyleInfo, style_name: Optional[str] = None):
         """显示样式预览"""
-        # 应用样式到预览文本
+        char_format = self._char_format_cache.get(style_name) if style_name else None
+        if char_format is None:
+            char_format = self.build_char_format(style_info)
+            if style_name:
+                self._char_format_cache[style_name] = char_format
+        
+        # 整体替换预览文本的格式，而不是逐字符合并；使用光标副本，不改变编辑器中的选区
         cursor = self.preview_text.textCursor()
         cursor.select(QTextCursor.SelectionType.Document)
+        cursor.setCharFormat(char_format)
         
-        # 创建字符格式
+    def build_char_format(self, style_info: StyleInfo) -> QTextCharFormat:
+        """根据样式信息创建字符格式"""
         char_format = QTextCharFormat()
         
         if style_info.font_name:
@@ -269,7 +317,7 @@ class StyleViewer(QWidget):
             except Exception:
                 pass
                 
-        cursor.mergeCharFormat(char_format)
+        return char_format
         
     def show_style_details(self, style_info: StyleInfo):
         """显示样式详情"""
@@ -298,21 +346,28 @@ class StyleViewer(QWidget):
         
     def show_style_usage(self, style_name: str):
         """显示样式使用情况"""
-        self.usage_list.clear()
-        
-        usage_count = 0
-        for i, paragraph in enumerate(self.paragraphs_data):
-            # 这里简化处理，假设有样式名称信息
-            paragraph_style = getattr(paragraph, 'style_name', '正文')
-            if paragraph_style == style_name:
-                usage_count += 1
+        labels = self._usage_labels_by_style.get(style_name)
+        if labels is None:
+            # 条目文本在首次查看该样式时生成，之后直接复用
+            labels = []
+            for i, paragraph in self._paragraphs_by_style.get(style_name, []):
                 preview_text = paragraph.text[:50] + "..." if len(paragraph.text) > 50 else paragraph.text
-                item = QListWidgetItem(f"段落 {i+1}: {preview_text}")
+                labels.append(f"段落 {i+1}: {preview_text}")
+            self._usage_labels_by_style[style_name] = labels
+            
+        items = [QListWidgetItem(label) for label in labels]
+            
+        if not items:
+            items.append(QListWidgetItem("此样式未被使用"))
+            
+        # 整体替换列表内容，期间不重绘
+        self.usage_list.setUpdatesEnabled(False)
+        try:
+            self.usage_list.clear()
+            for item in items:
                 self.usage_list.addItem(item)
-                
-        if usage_count == 0:
-            item = QListWidgetItem("此样式未被使用")
-            self.usage_list.addItem(item)
+        finally:
+            self.usage_list.setUpdatesEnabled(True)
             
     def apply_style(self):
         """应用样式"""